@@ -0,0 +1,120 @@
+from datetime import date, datetime, time, timedelta
+from django.db.models import (
+    Avg,
+    Count,
+    DateField,
+    F,
+    Func,
+    IntegerField,
+    Max,
+    Min,
+    Sum,
+    Value,
+)
+from django.db.models.functions import Trunc
+from django.utils import timezone
+from .models import ExerciseSet, ExerciseType, Measurement
+
+VOLUME_GROUPS = {
+    "exercise_type": (
+        "exercise_log__exercise_type_id",
+        "exercise_log__exercise_type__name",
+    ),
+    "muscle_group": ("exercise_log__exercise_type__muscle_group", None),
+}
+
+
+class DaysBetween(Func):
+    """
+    Whole days from the second date expression to the first.
+    """
+
+    arg_joiner = " - "
+    template = "(%(expressions)s)"
+    output_field = IntegerField()
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def training_volume(user, period, group_by, start=None, end=None):
+    """
+    Aggregates a user's sets per `period` bucket ("day", "week" or "month") and
+    per exercise type or muscle group, entirely in the database: the rows
+    returned scale with the number of buckets, not the number of sets.
+    """
+    exercise_sets = ExerciseSet.objects.filter(exercise_log__workout_log__user=user)
+    # Compare against day boundaries so the begintime index stays usable.
+    if start is not None:
+        exercise_sets = exercise_sets.filter(
+            exercise_log__workout_log__begintime__gte=day_start(start)
+        )
+    if end is not None:
+        exercise_sets = exercise_sets.filter(
+            exercise_log__workout_log__begintime__lt=day_start(end + timedelta(days=1))
+        )
+
+    group_field, label_field = VOLUME_GROUPS[group_by]
+    rows = (
+        exercise_sets.values(
+            period_start=Trunc(
+                "exercise_log__workout_log__begintime",
+                period,
+                output_field=DateField(),
+            ),
+            group=F(group_field),
+            label=F(label_field or group_field),
+        )
+        .annotate(
+            tonnage=Sum("volume"),
+            best_e1rm=Max("e1rm"),
+            set_count=Count("id"),
+            rep_count=Sum("reps"),
+            average_rir=Avg("rir"),
+        )
+        .order_by("period_start", "label")
+    )
+
+    if label_field is None:
+        return [
+            {**row, "label": ExerciseType.MUSCLE_GROUPS.get(row["group"], row["group"])}
+            for row in rows
+        ]
+    return list(rows)
+
+
+def measurement_series(user, measurement_type, points, start=None, end=None):
+    """
+    Downsamples a user's measurements of one type to at most `points` buckets
+    of equal width between `start` and `end`, reporting the first date, count,
+    minimum, maximum and average of each bucket. Bucketing and aggregation run
+    in the database, so the payload is bounded by `points`.
+    """
+    measurements = Measurement.objects.filter(
+        user=user, measurement_type=measurement_type
+    )
+    if start is None or end is None:
+        bounds = measurements.aggregate(first=Min("date"), last=Max("date"))
+        start = start or bounds["first"]
+        end = end or bounds["last"] or date.today()
+        if start is None:
+            return []
+
+    span = (end - start).days + 1
+    return list(
+        measurements.filter(date__gte=start, date__lte=end)
+        .values(
+            bucket=DaysBetween(F("date"), Value(start, output_field=DateField()))
+            * Value(points)
+            / Value(span)
+        )
+        .annotate(
+            first_date=Min("date"),
+            count=Count("id"),
+            min=Min("value"),
+            max=Max("value"),
+            average=Avg("value"),
+        )
+        .order_by("bucket")
+    )
@@ -0,0 +1,183 @@
+"""
+Async read endpoints for workouts, measurements and the catalogs, mounted
+under `/api/v1/async/` next to their sync viewsets. They are plain Django
+async views rather than DRF views, so under ASGI a request waiting on the
+database does not hold a worker thread. The responses are byte-for-byte
+those of the sync endpoints: the same readers, fieldsets, filters, keyset
+cursors, ETags and renderer.
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from django.views import View
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from .authentication import AsyncJWTAuthentication
+from .cache import (
+    aget_catalog_version,
+    aget_data_version,
+    cache_catalog,
+    cached_catalog,
+)
+from .fieldsets import expands, parse_fieldset, relation
+from .models import ExerciseType, Measurement, MeasurementType, WorkoutLog
+from .pagination import MeasurementPagination, WorkoutLogPagination
+from .readers import (
+    MeasurementReader,
+    WorkoutLogReader,
+    exercise_log_rows,
+    exercise_set_rows,
+)
+from .renderers import ORJSONRenderer
+from .serializers import ExerciseTypeSerializer, MeasurementTypeSerializer
+from .timing import timed
+from .views import filter_workouts
+
+
+renderer = ORJSONRenderer()
+
+
+def json_response(data, status=200):
+    with timed("render"):
+        content = renderer.render(data)
+    return HttpResponse(content, status=status, content_type=renderer.media_type)
+
+
+async def fetch(queryset):
+    return [row async for row in queryset]
+
+
+class AsyncReadView(View):
+    """
+    Base of the async read views: handles `get` by awaiting the subclass's
+    `read(request, *args, **kwargs)`, and turns DRF exceptions into the
+    error responses DRF would have sent.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    authentication = AsyncJWTAuthentication()
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            return await self.read(request, *args, **kwargs)
+        except APIException as exc:
+            if isinstance(exc.detail, (list, dict)):
+                data = exc.detail
+            else:
+                data = {"detail": exc.detail}
+            response = json_response(data, status=exc.status_code)
+            if exc.status_code == 401:
+                response["WWW-Authenticate"] = self.authentication.authenticate_header(
+                    request
+                )
+            return response
+
+
+class UserDataView(AsyncReadView):
+    """
+    Paginated reads of the authenticated user's data, with the conditional
+    GET of `DataVersionMixin`: a weak ETag on the user's data version.
+    Subclasses answer a changed version with `read_page(request, user)`.
+    """
+
+    async def read(self, request, *args, **kwargs):
+        user = await self.authentication.aauthenticated_user(request)
+        etag = "W/" + quote_etag(await aget_data_version(user.id))
+        if_none_match = request.headers.get("If-None-Match", "")
+        if if_none_match.strip() == "*" or etag in parse_etags(if_none_match):
+            response = HttpResponse(status=304)
+        else:
+            response = await self.read_page(Request(request), user)
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+
+class WorkoutListView(UserDataView):
+    async def read_page(self, request, user):
+        fieldset = parse_fieldset(request.query_params)
+        workouts = filter_workouts(
+            WorkoutLog.objects.filter(user=user), request.query_params
+        )
+        paginator = WorkoutLogPagination()
+        page = await sync_to_async(paginator.paginate_queryset)(
+            WorkoutLogReader.values(workouts, fieldset), request
+        )
+
+        exercise_logs = exercise_sets = None
+        expand_logs, logs_fieldset = relation(fieldset, "exercise_logs", many=True)
+        if expand_logs:
+            exercise_logs = await fetch(
+                exercise_log_rows([workout["id"] for workout in page], logs_fieldset)
+            )
+            if expands(logs_fieldset, "exercise_sets", many=True):
+                exercise_sets = await fetch(
+                    exercise_set_rows([row["id"] for row in exercise_logs])
+                )
+        with timed("serialize"):
+            data = WorkoutLogReader.render(page, fieldset, exercise_logs, exercise_sets)
+        return json_response(paginator.get_paginated_data(data))
+
+
+class MeasurementListView(UserDataView):
+    async def read_page(self, request, user):
+        fieldset = parse_fieldset(request.query_params)
+        measurements = Measurement.objects.filter(user=user)
+        if expands(fieldset, "measurement_type"):
+            measurements = measurements.select_related("measurement_type")
+        paginator = MeasurementPagination()
+        page = await sync_to_async(paginator.paginate_queryset)(
+            MeasurementReader.values(measurements, fieldset), request
+        )
+        with timed("serialize"):
+            data = MeasurementReader.render(page, fieldset)
+        return json_response(paginator.get_paginated_data(data))
+
+
+class CatalogView(AsyncReadView):
+    """
+    Public catalog reads sharing the per-process cache and strong ETag of
+    `CatalogCacheMixin`.
+    """
+
+    catalog_name = None
+    queryset = None
+    serializer_class = None
+
+    async def read(self, request, *args, **kwargs):
+        version = await aget_catalog_version(self.catalog_name)
+        catalog = cached_catalog(self.catalog_name, version)
+        if catalog is None:
+            instances = await fetch(self.queryset.all())
+            with timed("serialize"):
+                data = self.serializer_class(instances, many=True).data
+            catalog = cache_catalog(self.catalog_name, version, data)
+        etag, data = catalog
+        etag = quote_etag(etag)
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponse(status=304)
+        else:
+            response = json_response(data)
+
+        response["ETag"] = etag
+        patch_cache_control(
+            response, public=True, max_age=settings.CATALOG_CACHE_MAX_AGE
+        )
+        return response
+
+
+class ExerciseTypeListView(CatalogView):
+    catalog_name = "exercise-types"
+    queryset = ExerciseType.objects.order_by("name")
+    serializer_class = ExerciseTypeSerializer
+
+
+class MeasurementTypeListView(CatalogView):
+    catalog_name = "measurement-types"
+    queryset = MeasurementType.objects.order_by("id")
+    serializer_class = MeasurementTypeSerializer
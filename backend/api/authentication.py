@@ -0,0 +1,140 @@
+import time
+from copy import copy
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+from .cache import aget_user_version, get_user_version, is_shared_cache
+
+# Users authenticated by this process by id, as (version, expiry, user)
+# triples; the user is None once deleted.
+USER_CACHE = {}
+
+
+def load_user(user_id, version, user):
+    if len(USER_CACHE) >= settings.USER_CACHE_MAX_SIZE:
+        USER_CACHE.clear()
+    USER_CACHE[user_id] = (
+        version,
+        time.monotonic() + settings.USER_CACHE_TIMEOUT,
+        user,
+    )
+    return user
+
+
+def cached_entry(user_id, version):
+    entry = USER_CACHE.get(user_id)
+    if entry is None or entry[0] != version or entry[1] < time.monotonic():
+        return None
+    return entry
+
+
+def user_query(user_id):
+    return get_user_model().objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+
+
+def cached_user(user_id):
+    """
+    Returns the user with `user_id` from this process's cache, loading it on
+    a miss, or None if there is no such user. Entries last
+    `settings.USER_CACHE_TIMEOUT` seconds at most and are dropped at once
+    when the user's version moves on (see `api.signals`). Each call gets its
+    own copy, so requests cannot see each other's changes.
+
+    Versions only reach other processes through a shared cache; with a
+    per-process one the user is loaded on every call instead.
+    """
+    if not is_shared_cache():
+        return user_query(user_id).first()
+    version = get_user_version(user_id)
+    entry = cached_entry(user_id, version)
+    if entry is not None:
+        user = entry[2]
+    else:
+        user = load_user(user_id, version, user_query(user_id).first())
+    return copy(user)
+
+
+async def acached_user(user_id):
+    if not is_shared_cache():
+        return await user_query(user_id).afirst()
+    version = await aget_user_version(user_id)
+    entry = cached_entry(user_id, version)
+    if entry is not None:
+        user = entry[2]
+    else:
+        user = load_user(user_id, version, await user_query(user_id).afirst())
+    return copy(user)
+
+
+class CachedUserJWTAuthentication(JWTAuthentication):
+    """
+    Trusts the claims of a valid token and takes its user from the cache of
+    `cached_user`, so with a shared cache authenticating does not query the
+    user table on every request. The checks on the user are simplejwt's.
+    """
+
+    def get_user(self, validated_token):
+        user = cached_user(self.get_user_id(validated_token))
+        return self.check_user(user, validated_token)
+
+    def get_user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+    def check_user(self, user, validated_token):
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
+
+
+class AsyncJWTAuthentication(CachedUserJWTAuthentication):
+    """
+    The authentication of the async views in `api.async_views`, which run
+    outside DRF: the token checks are the same, the user cache is read with
+    the async cache and ORM APIs.
+    """
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        user = await acached_user(self.get_user_id(validated_token))
+        return self.check_user(user, validated_token)
+
+    async def aauthenticated_user(self, request):
+        """
+        Returns the user the request authenticates as, raising
+        `NotAuthenticated` for anonymous requests like `IsAuthenticated`.
+        """
+        result = await self.aauthenticate(request)
+        if result is None:
+            raise NotAuthenticated()
+        return result[0]
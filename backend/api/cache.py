@@ -0,0 +1,163 @@
+import json
+import time
+from hashlib import md5
+from urllib.parse import urlencode
+from uuid import uuid4
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+
+
+def is_shared_cache():
+    """
+    Whether every process sees the same default cache. Local memory caches
+    are per process, and the dummy cache stores nothing, so versions kept in
+    them cannot invalidate anything another process holds.
+    """
+    return not isinstance(caches["default"], (DummyCache, LocMemCache))
+
+
+def data_version_key(user_id):
+    return f"data-version:{user_id}"
+
+
+def get_version(key):
+    """
+    Returns the opaque version stored under `key`. Versions are random rather
+    than counters, so an evicted key can never hand a stale version back out.
+    """
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid4().hex, timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def aget_version(key):
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, uuid4().hex, timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def bump_version(key):
+    cache.set(key, uuid4().hex, timeout=None)
+
+
+def get_data_version(user_id):
+    """
+    Returns the version of everything a user has logged.
+    """
+    return get_version(data_version_key(user_id))
+
+
+async def aget_data_version(user_id):
+    return await aget_version(data_version_key(user_id))
+
+
+def bump_data_version(user_id):
+    bump_version(data_version_key(user_id))
+
+
+def catalog_version_key(name):
+    return f"catalog-version:{name}"
+
+
+def get_catalog_version(name):
+    """
+    Returns the version of a shared catalog such as the exercise types.
+    """
+    return get_version(catalog_version_key(name))
+
+
+async def aget_catalog_version(name):
+    return await aget_version(catalog_version_key(name))
+
+
+def bump_catalog_version(name):
+    bump_version(catalog_version_key(name))
+
+
+def user_version_key(user_id):
+    return f"user-version:{user_id}"
+
+
+def get_user_version(user_id):
+    """
+    Returns the version of a user's account, which moves on whenever the
+    user is saved or deleted.
+    """
+    return get_version(user_version_key(user_id))
+
+
+async def aget_user_version(user_id):
+    return await aget_version(user_version_key(user_id))
+
+
+def bump_user_version(user_id):
+    bump_version(user_version_key(user_id))
+
+
+# Serialized catalogs of this process by name, as (version, expiry, etag, data).
+CATALOG_CACHE = {}
+
+
+def cached_catalog(name, version):
+    """
+    Returns the (etag, data) pair this process keeps for catalog `name` at
+    `version`, or None once the version has moved on or the entry expired.
+    """
+    entry = CATALOG_CACHE.get(name)
+    if entry is None or entry[0] != version or entry[1] < time.monotonic():
+        return None
+    return entry[2], entry[3]
+
+
+def cache_catalog(name, version, data):
+    """
+    Keeps a serialized catalog for `settings.CATALOG_CACHE_TIMEOUT` seconds,
+    which bounds how long a change whose version bump this process never saw
+    stays hidden: one made through a per-process cache, or by a queryset
+    update that sends no signals. The ETag hashes the data rather than the
+    version, so it moves on with every change served.
+    """
+    content = json.dumps(data, sort_keys=True, default=str).encode()
+    etag = md5(content, usedforsecurity=False).hexdigest()
+    CATALOG_CACHE[name] = (
+        version,
+        time.monotonic() + settings.CATALOG_CACHE_TIMEOUT,
+        etag,
+        data,
+    )
+    return etag, data
+
+
+RESPONSE_CACHE_COUNTERS = {
+    "hits": "response-cache:hits",
+    "misses": "response-cache:misses",
+}
+
+
+def response_cache_key(user_id, version, renderer_format, path, query_params):
+    query = urlencode(sorted(query_params.lists()), doseq=True)
+    digest = md5(f"{path}?{query}".encode(), usedforsecurity=False).hexdigest()
+    return f"response:{user_id}:{version}:{renderer_format}:{digest}"
+
+
+def count_response_cache(event):
+    key = RESPONSE_CACHE_COUNTERS[event]
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Evicted between add() and incr(); losing one sample is fine.
+        pass
+
+
+def response_cache_stats():
+    counters = cache.get_many(RESPONSE_CACHE_COUNTERS.values())
+    return {
+        event: counters.get(key, 0) for event, key in RESPONSE_CACHE_COUNTERS.items()
+    }
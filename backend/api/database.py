@@ -0,0 +1,13 @@
+from django.db import connections
+
+
+def connection_pool_stats(alias="default"):
+    """
+    Returns the statistics of this process's connection pool for `alias`
+    (see psycopg_pool's `ConnectionPool.get_stats`), or None when that
+    database is not pooled.
+    """
+    pool = getattr(connections[alias], "pool", None)
+    if pool is None:
+        return None
+    return pool.get_stats()
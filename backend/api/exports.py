@@ -0,0 +1,90 @@
+"""
+Row sources for the full-history exports. Rows are read through a
+server-side cursor in chunks and formatted like the API formats them, so
+memory stays flat however long the history is.
+"""
+
+from asgiref.sync import sync_to_async
+from .models import ExerciseSet, Measurement
+from .readers import format_date, format_datetime, format_decimal
+
+EXPORT_CHUNK_SIZE = 2000
+
+# (column, lookup, formatter) triples, in output order.
+WORKOUT_EXPORT_COLUMNS = (
+    ("workout_id", "exercise_log__workout_log_id", None),
+    ("begintime", "exercise_log__workout_log__begintime", format_datetime),
+    ("endtime", "exercise_log__workout_log__endtime", format_datetime),
+    ("exercise_log_id", "exercise_log_id", None),
+    ("exercise_type_id", "exercise_log__exercise_type_id", None),
+    ("exercise_type", "exercise_log__exercise_type__name", None),
+    ("muscle_group", "exercise_log__exercise_type__muscle_group", None),
+    ("set_id", "id", None),
+    ("reps", "reps", None),
+    ("weight_kg", "weight_kg", format_decimal),
+    ("rir", "rir", None),
+    ("e1rm", "e1rm", format_decimal),
+    ("volume", "volume", format_decimal),
+)
+
+MEASUREMENT_EXPORT_COLUMNS = (
+    ("measurement_id", "id", None),
+    ("date", "date", format_date),
+    ("measurement_type_id", "measurement_type_id", None),
+    ("measurement_type", "measurement_type__name", None),
+    ("unit", "measurement_type__unit", None),
+    ("value", "value", format_decimal),
+)
+
+
+def export_rows(queryset, columns):
+    lookups = [lookup for _, lookup, _ in columns]
+    formatters = [
+        (index, formatter)
+        for index, (_, _, formatter) in enumerate(columns)
+        if formatter is not None
+    ]
+    rows = queryset.values_list(*lookups).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    for row in rows:
+        row = list(row)
+        for index, formatter in formatters:
+            row[index] = formatter(row[index])
+        yield row
+
+
+def workout_export(user):
+    """
+    One row per exercise set, carrying its workout and exercise, in workout
+    order. Workouts without sets have no rows.
+    """
+    exercise_sets = ExerciseSet.objects.filter(
+        exercise_log__workout_log__user=user
+    ).order_by(
+        "exercise_log__workout_log__begintime",
+        "exercise_log__workout_log_id",
+        "exercise_log_id",
+        "id",
+    )
+    return [name for name, _, _ in WORKOUT_EXPORT_COLUMNS], export_rows(
+        exercise_sets, WORKOUT_EXPORT_COLUMNS
+    )
+
+
+def measurement_export(user):
+    measurements = Measurement.objects.filter(user=user).order_by("date", "id")
+    return [name for name, _, _ in MEASUREMENT_EXPORT_COLUMNS], export_rows(
+        measurements, MEASUREMENT_EXPORT_COLUMNS
+    )
+
+
+async def aiterate(iterator):
+    """
+    Yields the items of a sync iterator, taking each one with
+    `sync_to_async`. ASGI servers read sync streaming content whole before
+    sending anything, so exports served over ASGI go through this instead.
+    The steps share one thread, as the server-side cursor needs.
+    """
+    iterator = iter(iterator)
+    done = object()
+    while (item := await sync_to_async(next)(iterator, done)) is not done:
+        yield item
@@ -0,0 +1,116 @@
+"""
+Sparse fieldsets for the read endpoints, driven by two query parameters:
+
+- `fields` lists the fields to render, as comma-separated dotted paths
+  (`fields=begintime,exercise_logs.exercise_type.name`). A level with no
+  field listed renders all of its plain fields.
+- `expand` lists the relations to render as nested objects, also as dotted
+  paths (`expand=exercise_logs.exercise_sets`). Listing a path below a
+  relation in `fields` expands that relation too.
+
+Once either parameter is given, relations that are not expanded collapse:
+to-one relations render as their primary key and to-many relations are left
+out, so they are neither serialized nor loaded. Without either parameter
+responses keep their full shape.
+"""
+
+
+class Fieldset:
+    """
+    The fields to render at one level of a response and the fieldsets of the
+    relations expanded below it.
+    """
+
+    def __init__(self):
+        self.fields = None
+        self.expanded = {}
+
+    def select(self, name):
+        if self.fields is None:
+            self.fields = set()
+        self.fields.add(name)
+
+    def expand(self, name):
+        return self.expanded.setdefault(name, Fieldset())
+
+    def includes(self, name):
+        return self.fields is None or name in self.fields
+
+    def nested(self, name, many=False):
+        """
+        Returns the fieldset to render relation `name` with, or None when it
+        is collapsed. A to-many relation listed in `fields` is expanded.
+        """
+        if name in self.expanded:
+            return self.expanded[name]
+        if many and self.fields is not None and name in self.fields:
+            return Fieldset()
+        return None
+
+
+def split_paths(value):
+    return [path.split(".") for path in value.split(",") if path.strip()]
+
+
+def parse_fieldset(query_params):
+    """
+    Returns the root fieldset requested by `query_params`, or None when the
+    full response is wanted.
+    """
+    fields = query_params.get("fields", "")
+    expand = query_params.get("expand", "")
+    if not fields.strip() and not expand.strip():
+        return None
+
+    root = Fieldset()
+    for path in split_paths(fields):
+        level = root
+        for name in path[:-1]:
+            level.select(name.strip())
+            level = level.expand(name.strip())
+        level.select(path[-1].strip())
+    for path in split_paths(expand):
+        level = root
+        for name in path:
+            level = level.expand(name.strip())
+    return root
+
+
+def relation(fieldset, name, many=False):
+    """
+    Returns whether relation `name` below `fieldset` is rendered as objects,
+    and the fieldset to render them with.
+    """
+    if fieldset is None:
+        return True, None
+    nested = fieldset.nested(name, many=many)
+    return nested is not None, nested
+
+
+def prune(item, fieldset, relations=()):
+    """
+    Drops the plain fields of a rendered item that `fieldset` leaves out;
+    `relations` name the keys the caller has already settled.
+    """
+    if fieldset is None:
+        return item
+    return {
+        name: value
+        for name, value in item.items()
+        if name in relations or fieldset.includes(name)
+    }
+
+
+def expands(fieldset, *path, many=False):
+    """
+    Whether the relation at `path` below `fieldset` is rendered as objects;
+    everything is when `fieldset` is None. The last relation of the path is
+    to-many when `many` is set, the ones above it always are.
+    """
+    if fieldset is None:
+        return True
+    for index, name in enumerate(path):
+        fieldset = fieldset.nested(name, many=many or index < len(path) - 1)
+        if fieldset is None:
+            return False
+    return True
@@ -0,0 +1,143 @@
+"""
+Bulk history imports. Rows are validated one by one with a shared serializer
+after every referenced type has been resolved in a single query; invalid rows
+are reported and skipped, and the valid ones are written with large batched
+INSERTs inside one transaction.
+"""
+
+from django.db import transaction
+from django.db.models import Q
+from rest_framework import serializers
+from .models import (
+    ExerciseLog,
+    ExerciseSet,
+    ExerciseType,
+    Measurement,
+    MeasurementType,
+    WorkoutLog,
+)
+from .records import rebuild_personal_records
+from .serializers import MeasurementImportRowSerializer, WorkoutImportRowSerializer
+
+IMPORT_BATCH_SIZE = 1000
+
+
+def validate_rows(serializer, rows):
+    """
+    Returns the (row number, validated data) pairs of the valid rows and the
+    errors of the others. Rows are numbered from 1.
+    """
+    valid, errors = [], []
+    for number, row in enumerate(rows, start=1):
+        try:
+            valid.append((number, serializer.run_validation(row)))
+        except serializers.ValidationError as exc:
+            errors.append({"row": number, "errors": exc.detail})
+    return valid, errors
+
+
+def referenced_names(rows, field):
+    return {
+        row[field]
+        for row in rows
+        if isinstance(row, dict) and isinstance(row.get(field), str)
+    }
+
+
+def import_workouts(user, rows):
+    exercise_types = ExerciseType.objects.filter(
+        Q(user=None) | Q(user=user),
+        name__in=referenced_names(rows, "exercise_type"),
+    )
+    serializer = WorkoutImportRowSerializer(
+        context={"exercise_types": {et.name: et for et in exercise_types}}
+    )
+    valid, errors = validate_rows(serializer, rows)
+
+    workouts, exercise_logs, exercise_sets = {}, {}, []
+    for number, data in valid:
+        workout_key = data.get("workout_id") or (data["begintime"], data["endtime"])
+        workout = workouts.get(workout_key)
+        if workout is None:
+            workout = workouts[workout_key] = WorkoutLog(
+                user=user, begintime=data["begintime"], endtime=data["endtime"]
+            )
+        elif (workout.begintime, workout.endtime) != (
+            data["begintime"],
+            data["endtime"],
+        ):
+            errors.append(
+                {
+                    "row": number,
+                    "errors": ["Times differ from earlier rows of this workout."],
+                }
+            )
+            continue
+
+        exercise_type = data["exercise_type"]
+        log_key = (workout_key, data.get("exercise_log_id") or exercise_type.id)
+        exercise_log = exercise_logs.get(log_key)
+        if exercise_log is None:
+            exercise_log = exercise_logs[log_key] = ExerciseLog(
+                workout_log=workout, exercise_type=exercise_type
+            )
+        elif exercise_log.exercise_type_id != exercise_type.id:
+            errors.append(
+                {
+                    "row": number,
+                    "errors": [
+                        "Exercise type differs from earlier rows of this exercise."
+                    ],
+                }
+            )
+            continue
+
+        exercise_sets.append(
+            ExerciseSet(
+                exercise_log=exercise_log,
+                reps=data["reps"],
+                weight_kg=data["weight_kg"],
+                rir=data["rir"],
+            )
+        )
+
+    with transaction.atomic():
+        WorkoutLog.objects.bulk_create(workouts.values(), batch_size=IMPORT_BATCH_SIZE)
+        ExerciseLog.objects.bulk_create(
+            exercise_logs.values(), batch_size=IMPORT_BATCH_SIZE
+        )
+        ExerciseSet.objects.bulk_create(exercise_sets, batch_size=IMPORT_BATCH_SIZE)
+        rebuild_personal_records(
+            user.id,
+            {exercise_log.exercise_type_id for exercise_log in exercise_logs.values()},
+        )
+
+    errors.sort(key=lambda error: error["row"])
+    return {
+        "imported": {
+            "workouts": len(workouts),
+            "exercise_logs": len(exercise_logs),
+            "exercise_sets": len(exercise_sets),
+        },
+        "errors": errors,
+    }
+
+
+def import_measurements(user, rows):
+    measurement_types = MeasurementType.objects.filter(
+        name__in=referenced_names(rows, "measurement_type")
+    )
+    serializer = MeasurementImportRowSerializer(
+        context={"measurement_types": {mt.name: mt for mt in measurement_types}}
+    )
+    valid, errors = validate_rows(serializer, rows)
+
+    # A later row for the same type and day replaces an earlier one.
+    measurements = {
+        (data["measurement_type"].id, data["date"]): Measurement(user=user, **data)
+        for _, data in valid
+    }
+    with transaction.atomic():
+        Measurement.objects.upsert(measurements.values(), batch_size=IMPORT_BATCH_SIZE)
+
+    return {"imported": {"measurements": len(measurements)}, "errors": errors}
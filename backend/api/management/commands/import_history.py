@@ -0,0 +1,55 @@
+from pathlib import Path
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from api.cache import bump_data_version
+from api.imports import import_measurements, import_workouts
+from api.parsers import read_csv_rows, read_ndjson_rows
+
+IMPORTERS = {"workouts": import_workouts, "measurements": import_measurements}
+READERS = {"csv": read_csv_rows, "ndjson": read_ndjson_rows}
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports a user's workout or measurement history from a CSV or NDJSON "
+        "file in the format of the export endpoints."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("kind", choices=IMPORTERS)
+        parser.add_argument("path", type=Path)
+        parser.add_argument("--user", type=int, required=True, dest="user_id")
+        parser.add_argument(
+            "--format",
+            choices=READERS,
+            help="File format; guessed from the file extension by default.",
+        )
+
+    def handle(self, *args, kind, path, user_id, format=None, **options):
+        try:
+            user = User.objects.get(id=user_id)
+        except User.DoesNotExist:
+            raise CommandError(f"User {user_id} does not exist.")
+
+        format = format or path.suffix.lstrip(".").lower()
+        if format not in READERS:
+            raise CommandError(
+                "Pass --format, the file extension is not csv or ndjson."
+            )
+
+        with path.open("rb") as stream:
+            rows = READERS[format](stream)
+        report = IMPORTERS[kind](user, rows)
+        bump_data_version(user.id)
+
+        for error in report["errors"]:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+        imported = ", ".join(
+            f"{count} {name.replace('_', ' ')}"
+            for name, count in report["imported"].items()
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {imported}; skipped {len(report['errors'])} row(s)."
+            )
+        )
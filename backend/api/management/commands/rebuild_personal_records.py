@@ -0,0 +1,34 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from api.cache import bump_data_version
+from api.records import rebuild_personal_records
+
+
+class Command(BaseCommand):
+    help = "Recomputes the personal records table from the workout history."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Only rebuild the records of this user id (repeatable).",
+        )
+
+    def handle(self, *args, user_ids=None, **options):
+        users = User.objects.order_by("id")
+        if user_ids:
+            users = users.filter(id__in=user_ids)
+
+        count = 0
+        for user_id in users.values_list("id", flat=True).iterator():
+            with transaction.atomic():
+                rebuild_personal_records(user_id)
+            bump_data_version(user_id)
+            count += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt personal records for {count} user(s).")
+        )
@@ -0,0 +1,116 @@
+import logging
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from .timing import RequestTimings, current_timings
+
+logger = logging.getLogger("api.timing")
+
+# Phases reported besides the total, in header order.
+PHASES = ("db", "serialize", "render", "app")
+
+
+class ServerTimingMiddleware:
+    """
+    Measures each request: database time and query count through the execute
+    wrapper of `api.timing.record_query`, the serialize and render phases marked with
+    `api.timing.timed`, and the remaining application time. Template
+    responses, which is what DRF views return, are timed as rendering from
+    `process_template_response` until they come back rendered.
+
+    The figures go out as one structured log line per request, and as a
+    `Server-Timing` header when `settings.SERVER_TIMING_HEADER` is on. Requests slower than `settings.SLOW_REQUEST_THRESHOLD_MS`
+    are logged as warnings together with their SQL.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        timings = request.timings = RequestTimings()
+        token = current_timings.set(timings)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        timings = request.timings = RequestTimings()
+        token = current_timings.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    def process_template_response(self, request, response):
+        timings = request.timings
+        timings.render_started = (
+            timings.elapsed(),
+            timings.durations["db"],
+            timings.durations["serialize"],
+        )
+        return response
+
+    def finish(self, request, response, timings):
+        total = timings.elapsed()
+        if hasattr(timings, "render_started"):
+            # Forms of the browsable API serialize while rendering.
+            started, db_before, serialize_before = timings.render_started
+            db = timings.durations["db"] - db_before
+            serialize = timings.durations["serialize"] - serialize_before
+            timings.add("render", total - started - db - serialize)
+        timings.durations["app"] = max(
+            total - sum(timings.durations[phase] for phase in PHASES[:-1]), 0
+        )
+
+        if settings.SERVER_TIMING_HEADER:
+            response["Server-Timing"] = server_timing(timings, total)
+        log_request(request, response, timings, total)
+        return response
+
+
+def server_timing(timings, total):
+    metrics = []
+    for phase in PHASES:
+        metric = f"{phase};dur={timings.durations[phase] * 1000:.1f}"
+        if phase == "db":
+            metric += f';desc="{len(timings.queries)} queries"'
+        metrics.append(metric)
+    metrics.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(metrics)
+
+
+def log_request(request, response, timings, total):
+    fields = {
+        "method": request.method,
+        "path": request.path,
+        "status": response.status_code,
+        "queries": len(timings.queries),
+        "total_ms": round(total * 1000, 1),
+        **{
+            f"{phase}_ms": round(timings.durations[phase] * 1000, 1) for phase in PHASES
+        },
+    }
+    message = " ".join(f"{name}={value}" for name, value in fields.items())
+
+    if total * 1000 < settings.SLOW_REQUEST_THRESHOLD_MS:
+        logger.info(message, extra={"timing": fields})
+        return
+    queries = [
+        {"sql": sql, "ms": round(seconds * 1000, 1)} for sql, seconds in timings.queries
+    ]
+    statements = "\n".join(f"  {query['ms']}ms {query['sql']}" for query in queries)
+    logger.warning(
+        "slow request %s\n%s",
+        message,
+        statements,
+        extra={"timing": fields, "queries": queries},
+    )
@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-17 09:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="measurement",
+            index=models.Index(
+                fields=["user", "date", "id"], name="measurement_user_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutlog",
+            index=models.Index(
+                fields=["user", "begintime", "id"], name="workoutlog_user_btime_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 6.0 on 2026-10-17 12:00
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0003_personalrecord"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exerciseset",
+            name="e1rm",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    django.db.models.expressions.CombinedExpression(
+                        models.F("weight_kg"),
+                        "*",
+                        django.db.models.expressions.CombinedExpression(
+                            django.db.models.expressions.CombinedExpression(
+                                models.Value(30), "+", models.F("reps")
+                            ),
+                            "+",
+                            models.F("rir"),
+                        ),
+                    ),
+                    "/",
+                    models.Value(30),
+                ),
+                output_field=models.DecimalField(decimal_places=2, max_digits=7),
+            ),
+        ),
+        migrations.AddField(
+            model_name="exerciseset",
+            name="volume",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.expressions.CombinedExpression(
+                    models.F("reps"), "*", models.F("weight_kg")
+                ),
+                output_field=models.DecimalField(decimal_places=2, max_digits=8),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="exerciseset",
+            index=models.Index(
+                fields=["exercise_log", "-e1rm"], name="exercise_set_e1rm_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-17 14:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def drop_duplicate_measurements(apps, schema_editor):
+    # Keep the latest measurement of each user, type and day.
+    Measurement = apps.get_model("api", "Measurement")
+    latest = (
+        Measurement.objects.values("user", "measurement_type", "date")
+        .annotate(latest_id=models.Max("id"))
+        .values("latest_id")
+    )
+    Measurement.objects.exclude(id__in=latest).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0004_exerciseset_e1rm_volume"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_measurements, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="measurement",
+            constraint=models.UniqueConstraint(
+                fields=("user", "measurement_type", "date"),
+                name="measurement_unique_user_mtype_date",
+            ),
+        ),
+    ]
@@ -0,0 +1,130 @@
+# Generated by Django 6.0 on 2026-10-17 16:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0006_exercisetype_name_trigram_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="exerciselog",
+            name="exercise_log_etype_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="exerciseset",
+            name="exercise_set_elog_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="exercisetype",
+            name="exercise_type_name_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="measurement",
+            name="measurement_user_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="measurement",
+            name="api_measure_user_id_791258_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="measurementtype",
+            name="measurement_type_name_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="userprofile",
+            name="user_profile_user_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="userprofile",
+            name="user_profile_created_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="workoutlog",
+            name="workoutlog_user_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="workoutlog",
+            name="workoutlog_created_idx",
+        ),
+        migrations.AlterField(
+            model_name="exerciselog",
+            name="exercise_type",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="api.exercisetype",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="exerciselog",
+            name="workout_log",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="exercise_logs",
+                to="api.workoutlog",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="exerciseset",
+            name="exercise_log",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="exercise_sets",
+                to="api.exerciselog",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="measurement_type",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="api.measurementtype",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="measurement",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="measurements",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="personalrecord",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="personal_records",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="workoutlog",
+            name="user",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="workouts",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="exerciselog",
+            index=models.Index(
+                fields=["exercise_type", "workout_log"],
+                name="exercise_log_etype_wlog_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 6.0 on 2026-10-17 18:40
+
+from django.db import migrations
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+
+BATCH_SIZE = 1000
+
+
+def backfill_personal_records(apps, schema_editor):
+    # Records are kept up to date as sets are logged, so the history from
+    # before the table existed has to be ranked once, the way
+    # api.records.best_sets ranks it.
+    ExerciseSet = apps.get_model("api", "ExerciseSet")
+    PersonalRecord = apps.get_model("api", "PersonalRecord")
+
+    best_sets = (
+        ExerciseSet.objects.filter(weight_kg__gt=0)
+        .annotate(
+            owner_id=F("exercise_log__workout_log__user_id"),
+            exercise_type_id=F("exercise_log__exercise_type_id"),
+            begintime=F("exercise_log__workout_log__begintime"),
+            rank=Window(
+                RowNumber(),
+                partition_by=[F("owner_id"), F("exercise_type_id")],
+                order_by=[
+                    F("weight_kg").desc(),
+                    F("reps").desc(),
+                    F("begintime").asc(),
+                    F("id").asc(),
+                ],
+            ),
+        )
+        .filter(rank=1)
+        .values_list(
+            "id", "owner_id", "exercise_type_id", "weight_kg", "reps", "begintime"
+        )
+    )
+
+    records = [
+        PersonalRecord(
+            user_id=user_id,
+            exercise_type_id=type_id,
+            exercise_set_id=set_id,
+            weight_kg=weight_kg,
+            reps=reps,
+            date=timezone.localdate(begintime),
+        )
+        for set_id, user_id, type_id, weight_kg, reps, begintime in best_sets
+    ]
+    PersonalRecord.objects.bulk_create(
+        records,
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["user", "exercise_type"],
+        update_fields=["exercise_set", "weight_kg", "reps", "date"],
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("api", "0007_index_audit"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_personal_records, migrations.RunPython.noop),
+    ]
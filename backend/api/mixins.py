@@ -0,0 +1,249 @@
+from functools import cache as memoize
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+from .fieldsets import parse_fieldset
+from .timing import timed
+from .cache import (
+    cache_catalog,
+    cached_catalog,
+    get_data_version,
+    bump_data_version,
+    get_catalog_version,
+    response_cache_key,
+    count_response_cache,
+)
+
+
+class TimedData:
+    """
+    Times reads of a serializer's `data` as the serialize phase of
+    `api.timing`.
+    """
+
+    @property
+    def data(self):
+        with timed("serialize"):
+            return super().data
+
+
+@memoize
+def timed_serializer_class(serializer_class):
+    return type(serializer_class.__name__, (TimedData, serializer_class), {})
+
+
+class ServerTimingMixin:
+    """
+    Base of every viewset: serializers from `get_serializer` time their
+    `data` as the serialize phase of `ServerTimingMiddleware`, whether the
+    response is a read or a write. Actions serializing with another class
+    than the viewset's pass it as `serializer_class`.
+    """
+
+    def get_serializer_context(self):
+        return {"request": self.request, "format": self.format_kwarg, "view": self}
+
+    def get_serializer(self, *args, serializer_class=None, **kwargs):
+        if serializer_class is None:
+            serializer = super().get_serializer(*args, **kwargs)
+        else:
+            kwargs.setdefault("context", self.get_serializer_context())
+            serializer = serializer_class(*args, **kwargs)
+        # `many=True` makes a list serializer, so wrap whatever was built.
+        serializer.__class__ = timed_serializer_class(type(serializer))
+        return serializer
+
+
+class NotModified(Exception):
+    pass
+
+
+class DataVersionMixin:
+    """
+    Conditional GET for per-user data. Reads carry the user's data version as
+    a weak ETag and answer a matching If-None-Match with 304 before the
+    handler runs, so neither the tables nor the serializers are touched.
+    Successful writes through the view bump the version.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in ("GET", "HEAD"):
+            self.data_version = get_data_version(request.user.id)
+            self.etag = "W/" + quote_etag(self.data_version)
+            if_none_match = request.headers.get("If-None-Match", "")
+            if if_none_match.strip() == "*" or self.etag in parse_etags(if_none_match):
+                raise NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if request.method not in SAFE_METHODS:
+            if status.is_success(response.status_code):
+                bump_data_version(request.user.id)
+        elif hasattr(self, "etag") and response.status_code in (200, 304):
+            response["ETag"] = self.etag
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ["Authorization"])
+        return response
+
+
+class CachedResponse(Exception):
+    def __init__(self, content, content_type):
+        self.content = content
+        self.content_type = content_type
+
+
+class ResponseCacheMixin(DataVersionMixin):
+    """
+    Caches rendered GET responses per user, data version and query string.
+    Writes bump the data version, which moves every later read of that user
+    to fresh keys; stale entries simply expire.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method == "GET":
+            self.response_cache_key = response_cache_key(
+                request.user.id,
+                self.data_version,
+                request.accepted_renderer.format,
+                request.path,
+                request.query_params,
+            )
+            cached = cache.get(self.response_cache_key)
+            if cached is not None:
+                count_response_cache("hits")
+                raise CachedResponse(*cached)
+            count_response_cache("misses")
+
+    def handle_exception(self, exc):
+        if isinstance(exc, CachedResponse):
+            return HttpResponse(exc.content, content_type=exc.content_type)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "response_cache_key", None)
+        if key is not None and isinstance(response, Response):
+            if response.status_code == status.HTTP_200_OK:
+                response.add_post_render_callback(
+                    lambda rendered: cache.set(
+                        key,
+                        (rendered.content, rendered["Content-Type"]),
+                        settings.RESPONSE_CACHE_TIMEOUT,
+                    )
+                )
+        return response
+
+
+class SparseFieldsetMixin:
+    """
+    Parses the `fields` and `expand` query parameters of `list` and
+    `retrieve` into a fieldset (see `api.fieldsets`) and hands it to the
+    serializer. `get_queryset` can consult `get_fieldset` to load only the
+    relations that will be rendered.
+    """
+
+    def get_fieldset(self):
+        if self.action not in ("list", "retrieve"):
+            return None
+        if not hasattr(self, "_fieldset"):
+            self._fieldset = parse_fieldset(self.request.query_params)
+        return self._fieldset
+
+    def get_serializer(self, *args, **kwargs):
+        fieldset = self.get_fieldset()
+        if fieldset is not None:
+            kwargs.setdefault("fieldset", fieldset)
+        return super().get_serializer(*args, **kwargs)
+
+
+class FastReadMixin:
+    """
+    Serves `list` and `retrieve` through `fast_reader` (see `api.readers`)
+    when one is set, instead of the serializer returned by
+    `get_serializer_class`. Set `fast_reader = None` to use the serializers.
+    Honours the fieldset of `SparseFieldsetMixin` when that precedes it.
+    Rendering rows is timed as the serialize phase of `api.timing`, like the
+    serializers of `ServerTimingMixin`.
+    """
+
+    fast_reader = None
+
+    def get_fieldset(self):
+        return None
+
+    def get_fast_queryset(self):
+        return self.fast_reader.values(
+            self.filter_queryset(self.get_queryset()), self.get_fieldset()
+        )
+
+    def list(self, request, *args, **kwargs):
+        if self.fast_reader is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.get_fast_queryset()
+        page = self.paginate_queryset(queryset)
+        rows = list(queryset) if page is None else page
+        with timed("serialize"):
+            data = self.fast_reader.render(rows, self.get_fieldset())
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    def retrieve(self, request, *args, **kwargs):
+        if self.fast_reader is None:
+            return super().retrieve(request, *args, **kwargs)
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        row = get_object_or_404(
+            self.get_fast_queryset(),
+            **{self.lookup_field: kwargs[lookup_url_kwarg]},
+        )
+        with timed("serialize"):
+            data = self.fast_reader.render([row], self.get_fieldset())[0]
+        return Response(data)
+
+
+class CatalogCacheMixin:
+    """
+    Serves `list` of a shared catalog from memory. The serialized catalog is
+    kept per process and reused until the catalog version, bumped by the
+    signals in `api.signals` whenever the table changes, moves on, or for
+    `settings.CATALOG_CACHE_TIMEOUT` seconds at most (see `cache_catalog`).
+    Responses carry a hash of the catalog as a strong ETag and may be cached
+    publicly for `settings.CATALOG_CACHE_MAX_AGE` seconds.
+    """
+
+    catalog_name = None
+
+    def list(self, request, *args, **kwargs):
+        version = get_catalog_version(self.catalog_name)
+        catalog = cached_catalog(self.catalog_name, version)
+        if catalog is None:
+            data = super().list(request, *args, **kwargs).data
+            catalog = cache_catalog(self.catalog_name, version, data)
+        etag, data = catalog
+        etag = quote_etag(etag)
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(data)
+
+        response["ETag"] = etag
+        patch_cache_control(
+            response, public=True, max_age=settings.CATALOG_CACHE_MAX_AGE
+        )
+        return response
@@ -2,18 +2,98 @@ from humanize import naturaldelta, naturaldate
 
 from datetime import date
 from django.db import models
-from django.db.models import Q, F
-from django.db.models.functions import Now, Cast
+from django.db.models import Q, F, Prefetch, Value
+from django.db.models.functions import Now, Cast, Coalesce, Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.contrib.auth.models import User
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.core.exceptions import ValidationError
 
 
+def exercise_tree_prefetch(exercise_type=True, exercise_sets=True):
+    """
+    Prefetch plan that loads a workout's exercise logs joined with their
+    exercise type, and the sets of every log, in two queries. Both levels are
+    ordered by id so every read path renders them in the same order. The
+    type join and the sets can be left out when they will not be rendered.
+    """
+    exercise_logs = ExerciseLog.objects.order_by("id")
+    if exercise_type:
+        exercise_logs = exercise_logs.select_related("exercise_type")
+    if exercise_sets:
+        exercise_logs = exercise_logs.prefetch_related(exercise_sets_prefetch())
+    return Prefetch("exercise_logs", queryset=exercise_logs)
+
+
+def exercise_sets_prefetch():
+    return Prefetch("exercise_sets", queryset=ExerciseSet.objects.order_by("id"))
+
+
+class WorkoutLogQuerySet(models.QuerySet):
+    def with_exercise_tree(self, **parts):
+        return self.prefetch_related(exercise_tree_prefetch(**parts))
+
+    def summaries(self):
+        """
+        One row per workout with its duration, exercise and set counts and
+        total volume, all computed by the database. The figures come from
+        correlated subqueries rather than joins, so with ORDER BY and LIMIT
+        they are only computed for the workouts returned.
+        """
+        exercise_logs = ExerciseLog.objects.filter(
+            workout_log=models.OuterRef("pk")
+        ).values("workout_log")
+        exercise_sets = ExerciseSet.objects.filter(
+            exercise_log__workout_log=models.OuterRef("pk")
+        ).values("exercise_log__workout_log")
+        return self.values(
+            "id",
+            "begintime",
+            "endtime",
+            duration=models.ExpressionWrapper(
+                F("endtime") - F("begintime"), output_field=models.DurationField()
+            ),
+            exercise_count=Coalesce(
+                models.Subquery(
+                    exercise_logs.annotate(count=models.Count("id")).values("count")
+                ),
+                0,
+            ),
+            set_count=Coalesce(
+                models.Subquery(
+                    exercise_sets.annotate(count=models.Count("id")).values("count")
+                ),
+                0,
+            ),
+            total_volume=Coalesce(
+                models.Subquery(
+                    exercise_sets.annotate(volume=models.Sum("volume")).values("volume")
+                ),
+                Value(0),
+                output_field=models.DecimalField(max_digits=12, decimal_places=2),
+            ),
+        )
+
+    def with_exercise(self, **lookups):
+        """
+        Workouts with at least one exercise log matching `lookups`. Uses an
+        EXISTS subquery, so a workout is returned once however many of its
+        logs match.
+        """
+        return self.filter(
+            models.Exists(
+                ExerciseLog.objects.filter(workout_log=models.OuterRef("pk"), **lookups)
+            )
+        )
+
+
 class WorkoutLog(models.Model):
     class Meta:
+        # Foreign keys whose column leads one of these indexes skip their own.
         indexes = [
-            models.Index(fields=["user"], name="workoutlog_user_idx"),
-            models.Index(fields=["created"], name="workoutlog_created_idx"),
+            models.Index(
+                fields=["user", "begintime", "id"], name="workoutlog_user_btime_idx"
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -26,7 +106,11 @@ class WorkoutLog(models.Model):
     endtime = models.DateTimeField()
     created = models.DateTimeField(auto_now_add=True)
 
-    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="workouts")
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="workouts", db_index=False
+    )
+
+    objects = WorkoutLogQuerySet.as_manager()
 
     @property
     def duration(self) -> str:
@@ -43,8 +127,12 @@ class WorkoutLog(models.Model):
 class ExerciseType(models.Model):
     class Meta:
         indexes = [
-            models.Index(fields=["name"], name="exercise_type_name_idx"),
             models.Index(fields=["muscle_group"], name="exercise_type_mgroup_idx"),
+            # Serves prefix (LIKE 'x%') and trigram similarity searches.
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="exercise_type_name_trgm_idx",
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -78,13 +166,21 @@ class ExerciseType(models.Model):
 class ExerciseLog(models.Model):
     class Meta:
         indexes = [
-            models.Index(fields=["exercise_type"], name="exercise_log_etype_idx"),
+            models.Index(
+                fields=["exercise_type", "workout_log"],
+                name="exercise_log_etype_wlog_idx",
+            ),
             models.Index(fields=["workout_log"], name="exercise_log_wlog_idx"),
         ]
 
-    exercise_type = models.ForeignKey(ExerciseType, on_delete=models.CASCADE)
+    exercise_type = models.ForeignKey(
+        ExerciseType, on_delete=models.CASCADE, db_index=False
+    )
     workout_log = models.ForeignKey(
-        WorkoutLog, on_delete=models.CASCADE, related_name="exercise_logs"
+        WorkoutLog,
+        on_delete=models.CASCADE,
+        related_name="exercise_logs",
+        db_index=False,
     )
 
     def __str__(self):
@@ -94,7 +190,9 @@ class ExerciseLog(models.Model):
 class ExerciseSet(models.Model):
     class Meta:
         indexes = [
-            models.Index(fields=["exercise_log"], name="exercise_set_elog_idx"),
+            models.Index(
+                fields=["exercise_log", "-e1rm"], name="exercise_set_e1rm_idx"
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -107,7 +205,10 @@ class ExerciseSet(models.Model):
         ]
 
     exercise_log = models.ForeignKey(
-        ExerciseLog, on_delete=models.CASCADE, related_name="exercise_sets"
+        ExerciseLog,
+        on_delete=models.CASCADE,
+        related_name="exercise_sets",
+        db_index=False,
     )
 
     reps = models.PositiveSmallIntegerField(validators=[MaxValueValidator(100)])
@@ -118,6 +219,19 @@ class ExerciseSet(models.Model):
     )
     rir = models.PositiveSmallIntegerField(validators=[MaxValueValidator(6)])
 
+    # Epley estimate counting reps in reserve as reps that could have been
+    # done: weight * (1 + (reps + rir) / 30). Stored and kept by the database.
+    e1rm = models.GeneratedField(
+        expression=F("weight_kg") * (Value(30) + F("reps") + F("rir")) / Value(30),
+        output_field=models.DecimalField(max_digits=7, decimal_places=2),
+        db_persist=True,
+    )
+    volume = models.GeneratedField(
+        expression=F("reps") * F("weight_kg"),
+        output_field=models.DecimalField(max_digits=8, decimal_places=2),
+        db_persist=True,
+    )
+
     def __str__(self):
         return f"{self.reps} reps - {self.weight_kg} kgs"
 
@@ -128,6 +242,34 @@ class ExerciseSet(models.Model):
             )
 
 
+class PersonalRecord(models.Model):
+    """
+    The heaviest set a user has logged for an exercise type, maintained by the
+    write paths through `api.records` so dashboards can read it directly.
+    """
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "exercise_type"], name="%(class)s_unique_user_etype"
+            )
+        ]
+
+    # The unique constraint's index leads with the user.
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="personal_records", db_index=False
+    )
+    exercise_type = models.ForeignKey(ExerciseType, on_delete=models.CASCADE)
+    exercise_set = models.ForeignKey(ExerciseSet, on_delete=models.CASCADE)
+
+    weight_kg = models.DecimalField(max_digits=6, decimal_places=2)
+    reps = models.PositiveSmallIntegerField()
+    date = models.DateField()
+
+    def __str__(self):
+        return f"{self.user} - {self.exercise_type.name}: {self.weight_kg} kgs x {self.reps}"
+
+
 def validate_birthdate(value):
     if (date.today() - value).days // 365 < UserProfile.MIN_AGE:
         raise ValidationError(
@@ -139,10 +281,6 @@ class UserProfile(models.Model):
     MIN_AGE = 16
 
     class Meta:
-        indexes = [
-            models.Index(fields=["user"], name="user_profile_user_idx"),
-            models.Index(fields=["created"], name="user_profile_created_idx"),
-        ]
         constraints = [
             # models.CheckConstraint(condition=Q(birthdate__lte=Cast(Now(), output_field=models.DateField())), name="%(class)s_birthdate_not_in_future"),
             models.CheckConstraint(
@@ -181,11 +319,6 @@ class UserProfile(models.Model):
 
 
 class MeasurementType(models.Model):
-    class Meta:
-        indexes = [
-            models.Index(fields=["name"], name="measurement_type_name_idx"),
-        ]
-
     name = models.CharField(max_length=100, unique=True)
     unit = models.CharField(max_length=10)
     created = models.DateTimeField(auto_now_add=True)
@@ -194,12 +327,28 @@ class MeasurementType(models.Model):
         return f"{self.name}: ({self.unit})"
 
 
+class MeasurementQuerySet(models.QuerySet):
+    def upsert(self, measurements, batch_size=None):
+        """
+        Inserts the measurements, overwriting the value of any the user
+        already logged for the same type and day, in one statement per batch.
+        """
+        return self.bulk_create(
+            measurements,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["user", "measurement_type", "date"],
+            update_fields=["value"],
+        )
+
+
 class Measurement(models.Model):
     class Meta:
         indexes = [
-            models.Index(fields=["user"], name="measurement_user_idx"),
             models.Index(fields=["measurement_type"], name="measurement_mtype_idx"),
-            models.Index(fields=["user", "measurement_type"]),
+            models.Index(
+                fields=["user", "date", "id"], name="measurement_user_date_idx"
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -209,17 +358,25 @@ class Measurement(models.Model):
             models.CheckConstraint(
                 condition=Q(value__gte=0), name="%(class)s_value_gte_0"
             ),
+            models.UniqueConstraint(
+                fields=["user", "measurement_type", "date"],
+                name="%(class)s_unique_user_mtype_date",
+            ),
         ]
 
     created = models.DateTimeField(auto_now_add=True)
     value = models.DecimalField(max_digits=6, decimal_places=2)
     date = models.DateField()
-    measurement_type = models.ForeignKey(MeasurementType, on_delete=models.CASCADE)
+    measurement_type = models.ForeignKey(
+        MeasurementType, on_delete=models.CASCADE, db_index=False
+    )
 
     user = models.ForeignKey(
-        User, on_delete=models.CASCADE, related_name="measurements"
+        User, on_delete=models.CASCADE, related_name="measurements", db_index=False
     )
 
+    objects = MeasurementQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.user} - {self.measurement_type.name}: {self.value} {self.measurement_type.unit}"
 
@@ -0,0 +1,28 @@
+from rest_framework.pagination import CursorPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination with a client-selectable page size capped by the server.
+    Subclasses order on a (timestamp, id) pair that is covered by a composite
+    index, so every page is an index range scan instead of an OFFSET scan.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 200
+
+    def get_paginated_data(self, data):
+        return {
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        }
+
+
+class WorkoutLogPagination(KeysetPagination):
+    ordering = ("-begintime", "-id")
+
+
+class MeasurementPagination(KeysetPagination):
+    ordering = ("-date", "-id")
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from .renderers import orjson
+
+
+class ORJSONParser(JSONParser):
+    """
+    Parses JSON request bodies with orjson, falling back to `JSONParser` when
+    orjson is not installed.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+def read_csv_rows(stream):
+    """
+    Reads CSV with a header line into a list of dicts.
+    """
+    return list(csv.DictReader(io.StringIO(stream.read().decode("utf-8-sig"))))
+
+
+def read_ndjson_rows(stream):
+    """
+    Reads newline-delimited JSON into a list with one item per non-blank line.
+    Lines that are not valid JSON are kept as their text so callers can
+    report them per row instead of rejecting the whole document.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    rows = []
+    for line in stream.read().decode("utf-8-sig").splitlines():
+        if not line.strip():
+            continue
+        try:
+            rows.append(loads(line))
+        except ValueError:
+            rows.append(line)
+    return rows
+
+
+class CSVParser(BaseParser):
+    media_type = "text/csv"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return read_csv_rows(stream)
+        except (UnicodeDecodeError, csv.Error) as exc:
+            raise ParseError(f"CSV parse error - {exc}")
+
+
+class NDJSONParser(BaseParser):
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return read_ndjson_rows(stream)
+        except UnicodeDecodeError as exc:
+            raise ParseError(f"NDJSON parse error - {exc}")
@@ -0,0 +1,222 @@
+"""
+Fast read paths that build the same JSON shapes as the read serializers from
+`.values()` rows with plain dict assembly, skipping DRF's per-field machinery.
+Dates are still formatted by DRF's own fields, so the output is identical to
+the serializers', sparse fieldsets included (see `api.fieldsets`).
+"""
+
+from rest_framework import serializers
+from .fieldsets import expands, prune, relation
+from .models import ExerciseLog, ExerciseSet
+
+
+format_datetime = serializers.DateTimeField().to_representation
+format_date = serializers.DateField().to_representation
+
+
+def format_decimal(value):
+    # Rows come from numeric(p, 2) columns and already carry two decimal
+    # places, which is exactly what DecimalField's quantizing would produce.
+    return format(value, "f")
+
+
+def exercise_set_rows(exercise_log_ids):
+    return (
+        ExerciseSet.objects.filter(exercise_log_id__in=exercise_log_ids)
+        .order_by("id")
+        .values_list(
+            "id", "exercise_log_id", "reps", "weight_kg", "rir", "e1rm", "volume"
+        )
+    )
+
+
+def read_exercise_sets(exercise_log_ids, fieldset=None, rows=None):
+    """
+    Returns the rendered sets of the given exercise logs, grouped by log id.
+    `rows` may hold the `exercise_set_rows` already fetched.
+    """
+    if rows is None:
+        rows = exercise_set_rows(exercise_log_ids)
+    sets_by_log = {exercise_log_id: [] for exercise_log_id in exercise_log_ids}
+    for id, exercise_log_id, reps, weight_kg, rir, e1rm, volume in rows:
+        sets_by_log[exercise_log_id].append(
+            prune(
+                {
+                    "id": id,
+                    "reps": reps,
+                    "weight_kg": format_decimal(weight_kg),
+                    "rir": rir,
+                    "e1rm": format_decimal(e1rm),
+                    "volume": format_decimal(volume),
+                },
+                fieldset,
+            )
+        )
+    return sets_by_log
+
+
+def read_exercise_logs(exercise_logs, fieldset=None, exercise_sets=None):
+    """
+    Renders exercise log rows carrying `id` and `exercise_type_id`, plus the
+    joined `exercise_type__*` columns when the type is expanded. Each exercise
+    type is rendered once and shared by every log that references it.
+    `exercise_sets` may hold the rows of their sets already fetched.
+    """
+    expand_type, type_fieldset = relation(fieldset, "exercise_type")
+    expand_sets, sets_fieldset = relation(fieldset, "exercise_sets", many=True)
+
+    exercise_types = {}
+    if expand_type:
+        for row in exercise_logs:
+            if row["exercise_type_id"] not in exercise_types:
+                exercise_types[row["exercise_type_id"]] = prune(
+                    {
+                        "id": row["exercise_type_id"],
+                        "name": row["exercise_type__name"],
+                        "muscle_group": row["exercise_type__muscle_group"],
+                        "custom_type": row["exercise_type__custom_type"],
+                    },
+                    type_fieldset,
+                )
+    if expand_sets:
+        sets_by_log = read_exercise_sets(
+            [row["id"] for row in exercise_logs], sets_fieldset, exercise_sets
+        )
+
+    rendered = []
+    for row in exercise_logs:
+        exercise_log = {"id": row["id"]}
+        if expand_type:
+            exercise_log["exercise_type"] = exercise_types[row["exercise_type_id"]]
+        elif fieldset.includes("exercise_type"):
+            exercise_log["exercise_type"] = row["exercise_type_id"]
+        if expand_sets:
+            exercise_log["exercise_sets"] = sets_by_log[row["id"]]
+        rendered.append(
+            prune(exercise_log, fieldset, ("exercise_type", "exercise_sets"))
+        )
+    return rendered
+
+
+EXERCISE_LOG_FIELDS = (
+    "id",
+    "workout_log_id",
+    "exercise_type_id",
+    "exercise_type__name",
+    "exercise_type__muscle_group",
+    "exercise_type__custom_type",
+)
+
+
+def exercise_log_fields(fieldset):
+    # Only join the exercise type when it is rendered.
+    if expands(fieldset, "exercise_type"):
+        return EXERCISE_LOG_FIELDS
+    return EXERCISE_LOG_FIELDS[:3]
+
+
+def exercise_log_rows(workout_ids, fieldset=None):
+    return (
+        ExerciseLog.objects.filter(workout_log_id__in=workout_ids)
+        .order_by("id")
+        .values(*exercise_log_fields(fieldset))
+    )
+
+
+class WorkoutLogReader:
+    """
+    Fast counterpart of `WorkoutLogReadSerializer`.
+    """
+
+    @staticmethod
+    def values(queryset, fieldset=None):
+        return queryset.prefetch_related(None).values("id", "begintime", "endtime")
+
+    @staticmethod
+    def render(workouts, fieldset=None, exercise_logs=None, exercise_sets=None):
+        """
+        `exercise_logs` and `exercise_sets` may hold the `exercise_log_rows`
+        and `exercise_set_rows` of the workouts already fetched, as the async
+        views do; otherwise they are queried here when rendered.
+        """
+        expand_logs, logs_fieldset = relation(fieldset, "exercise_logs", many=True)
+        if expand_logs:
+            if exercise_logs is None:
+                exercise_logs = list(
+                    exercise_log_rows(
+                        [workout["id"] for workout in workouts], logs_fieldset
+                    )
+                )
+            logs_by_workout = {workout["id"]: [] for workout in workouts}
+            for row, rendered in zip(
+                exercise_logs,
+                read_exercise_logs(exercise_logs, logs_fieldset, exercise_sets),
+            ):
+                logs_by_workout[row["workout_log_id"]].append(rendered)
+
+        rendered = []
+        for workout in workouts:
+            item = {
+                "id": workout["id"],
+                "begintime": format_datetime(workout["begintime"]),
+                "endtime": format_datetime(workout["endtime"]),
+            }
+            if expand_logs:
+                item["exercise_logs"] = logs_by_workout[workout["id"]]
+            rendered.append(prune(item, fieldset, ("exercise_logs",)))
+        return rendered
+
+
+class ExerciseLogReader:
+    """
+    Fast counterpart of `ExerciseLogReadSerializer`.
+    """
+
+    @staticmethod
+    def values(queryset, fieldset=None):
+        return queryset.prefetch_related(None).values(*exercise_log_fields(fieldset))
+
+    @staticmethod
+    def render(exercise_logs, fieldset=None):
+        return read_exercise_logs(list(exercise_logs), fieldset)
+
+
+class MeasurementReader:
+    """
+    Fast counterpart of `MeasurementReadSerializer`.
+    """
+
+    @staticmethod
+    def values(queryset, fieldset=None):
+        fields = ["id", "measurement_type_id", "value", "date"]
+        if expands(fieldset, "measurement_type"):
+            fields += ["measurement_type__name", "measurement_type__unit"]
+        return queryset.values(*fields)
+
+    @staticmethod
+    def render(measurements, fieldset=None):
+        expand_type, type_fieldset = relation(fieldset, "measurement_type")
+        measurement_types = {}
+        rendered = []
+        for row in measurements:
+            item = {"id": row["id"]}
+            if expand_type:
+                measurement_type = measurement_types.get(row["measurement_type_id"])
+                if measurement_type is None:
+                    measurement_type = measurement_types[row["measurement_type_id"]] = (
+                        prune(
+                            {
+                                "id": row["measurement_type_id"],
+                                "name": row["measurement_type__name"],
+                                "unit": row["measurement_type__unit"],
+                            },
+                            type_fieldset,
+                        )
+                    )
+                item["measurement_type"] = measurement_type
+            elif fieldset.includes("measurement_type"):
+                item["measurement_type"] = row["measurement_type_id"]
+            item["value"] = format_decimal(row["value"])
+            item["date"] = format_date(row["date"])
+            rendered.append(prune(item, fieldset, ("measurement_type",)))
+        return rendered
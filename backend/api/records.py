@@ -0,0 +1,140 @@
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+from .models import ExerciseSet, PersonalRecord
+
+
+def best_sets(user_id, exercise_type_ids=None):
+    """
+    Returns the record set of every exercise type a user has trained: the
+    heaviest set, then the most reps, then the earliest one logged.
+    """
+    exercise_sets = ExerciseSet.objects.filter(
+        exercise_log__workout_log__user_id=user_id, weight_kg__gt=0
+    )
+    if exercise_type_ids is not None:
+        exercise_sets = exercise_sets.filter(
+            exercise_log__exercise_type_id__in=exercise_type_ids
+        )
+
+    return exercise_sets.annotate(
+        exercise_type_id=F("exercise_log__exercise_type_id"),
+        begintime=F("exercise_log__workout_log__begintime"),
+        rank=Window(
+            RowNumber(),
+            partition_by=F("exercise_log__exercise_type_id"),
+            order_by=[
+                F("weight_kg").desc(),
+                F("reps").desc(),
+                F("exercise_log__workout_log__begintime").asc(),
+                F("id").asc(),
+            ],
+        ),
+    ).filter(rank=1)
+
+
+def save_personal_records(records):
+    PersonalRecord.objects.bulk_create(
+        records,
+        update_conflicts=True,
+        unique_fields=["user", "exercise_type"],
+        update_fields=["exercise_set", "weight_kg", "reps", "date"],
+    )
+
+
+def rebuild_personal_records(user_id, exercise_type_ids=None):
+    """
+    Recomputes a user's records from their history, for every exercise type or
+    only for the given ones.
+    """
+    if exercise_type_ids is not None and not exercise_type_ids:
+        return
+
+    records = [
+        PersonalRecord(
+            user_id=user_id,
+            exercise_type_id=exercise_set.exercise_type_id,
+            exercise_set=exercise_set,
+            weight_kg=exercise_set.weight_kg,
+            reps=exercise_set.reps,
+            date=timezone.localdate(exercise_set.begintime),
+        )
+        for exercise_set in best_sets(user_id, exercise_type_ids)
+    ]
+
+    stale_records = PersonalRecord.objects.filter(user_id=user_id).exclude(
+        exercise_type_id__in=[record.exercise_type_id for record in records]
+    )
+    if exercise_type_ids is not None:
+        stale_records = stale_records.filter(exercise_type_id__in=exercise_type_ids)
+    stale_records.delete()
+
+    if records:
+        save_personal_records(records)
+
+
+def record_exercise_sets(user_id, exercise_sets):
+    """
+    Promotes new or edited sets that beat the current record of their exercise
+    type. Types whose current record set was edited are recomputed instead,
+    since the edit may have made it lighter.
+
+    Each set must have its exercise log and workout log loaded.
+    """
+    exercise_type_ids = {
+        exercise_set.exercise_log.exercise_type_id for exercise_set in exercise_sets
+    }
+    records = {
+        record.exercise_type_id: record
+        for record in PersonalRecord.objects.filter(
+            user_id=user_id, exercise_type_id__in=exercise_type_ids
+        )
+    }
+
+    edited_type_ids = set()
+    candidates = {}
+    for exercise_set in exercise_sets:
+        exercise_type_id = exercise_set.exercise_log.exercise_type_id
+        record = records.get(exercise_type_id)
+        if record is not None and record.exercise_set_id == exercise_set.id:
+            edited_type_ids.add(exercise_type_id)
+            continue
+        if exercise_set.weight_kg <= 0:
+            continue
+
+        best = candidates.get(exercise_type_id) or record
+        if best is None or (exercise_set.weight_kg, exercise_set.reps) > (
+            best.weight_kg,
+            best.reps,
+        ):
+            candidates[exercise_type_id] = exercise_set
+
+    promoted = [
+        PersonalRecord(
+            user_id=user_id,
+            exercise_type_id=exercise_type_id,
+            exercise_set=exercise_set,
+            weight_kg=exercise_set.weight_kg,
+            reps=exercise_set.reps,
+            date=timezone.localdate(exercise_set.exercise_log.workout_log.begintime),
+        )
+        for exercise_type_id, exercise_set in candidates.items()
+        if exercise_type_id not in edited_type_ids
+    ]
+    if promoted:
+        save_personal_records(promoted)
+
+    rebuild_personal_records(user_id, edited_type_ids)
+
+
+def restore_personal_records(user_id, exercise_type_ids):
+    """
+    Recomputes the exercise types, among those that lost sets, whose record
+    was deleted along with its set.
+    """
+    exercise_type_ids = set(exercise_type_ids) - set(
+        PersonalRecord.objects.filter(
+            user_id=user_id, exercise_type_id__in=exercise_type_ids
+        ).values_list("exercise_type_id", flat=True)
+    )
+    rebuild_personal_records(user_id, exercise_type_ids)
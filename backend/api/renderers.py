@@ -0,0 +1,106 @@
+import csv
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised by patching in tests
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Renders JSON with orjson, byte-for-byte like DRF's `JSONRenderer` for the
+    compact output the API serves. Types orjson leaves to Python (Decimal, and
+    datetimes, which DRF formats its own way) go through DRF's encoder. Falls
+    back to `JSONRenderer` when orjson is not installed or indenting is asked
+    for, as the browsable API does.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        renderer_context = renderer_context or {}
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        ret = orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS,
+        )
+        # Like DRF, escape these so the output stays a strict JavaScript subset.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+
+class Echo:
+    """
+    File-like object that hands back what is written, for `csv.writer`.
+    """
+
+    def write(self, value):
+        return value
+
+
+class StreamingRenderer(BaseRenderer):
+    """
+    Base for renderers of flat rows that can also be streamed: `stream`
+    yields the encoded rows in chunks of `rows_per_chunk`. `render` takes a
+    dict or a list of dicts, which is what error responses carry. Subclasses
+    encode one row with `render_row(columns, row)`.
+    """
+
+    rows_per_chunk = 500
+
+    def header(self, columns):
+        return b""
+
+    def stream(self, columns, rows):
+        yield self.header(columns)
+        chunk = []
+        for row in rows:
+            chunk.append(self.render_row(columns, row))
+            if len(chunk) == self.rows_per_chunk:
+                yield b"".join(chunk)
+                chunk = []
+        if chunk:
+            yield b"".join(chunk)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if isinstance(data, dict):
+            data = [data]
+        columns = list(data[0]) if data else []
+        return b"".join(
+            self.stream(
+                columns, ([item.get(name) for name in columns] for item in data)
+            )
+        )
+
+
+class NDJSONRenderer(StreamingRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = None
+
+    def __init__(self):
+        self.json_renderer = ORJSONRenderer()
+
+    def render_row(self, columns, row):
+        return self.json_renderer.render(dict(zip(columns, row))) + b"\n"
+
+
+class CSVRenderer(StreamingRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+    def __init__(self):
+        self.writer = csv.writer(Echo())
+
+    def header(self, columns):
+        return self.writer.writerow(columns).encode()
+
+    def render_row(self, columns, row):
+        return self.writer.writerow(row).encode()
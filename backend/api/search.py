@@ -0,0 +1,32 @@
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.functions import Upper
+from .models import ExerciseType
+
+
+def search_exercise_types(q, limit, muscle_group=None):
+    """
+    Ranks exercise types for a type-ahead: names starting with `q` first,
+    then names containing a word similar to `q` (so typos still match), best
+    match first. Both tests use the trigram index on UPPER(name).
+    """
+    exercise_types = ExerciseType.objects.alias(upper_name=Upper("name"))
+    if muscle_group:
+        exercise_types = exercise_types.filter(muscle_group=muscle_group)
+
+    q = q.upper()
+    prefix = Case(
+        When(upper_name__startswith=q, then=Value(1)),
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    return list(
+        exercise_types.filter(
+            Q(upper_name__startswith=q) | Q(upper_name__trigram_word_similar=q)
+        )
+        .annotate(
+            prefix=prefix,
+            similarity=TrigramWordSimilarity(Value(q), "upper_name"),
+        )
+        .order_by("-prefix", "-similarity", "name")[:limit]
+    )
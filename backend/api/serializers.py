@@ -1,4 +1,5 @@
 from django.db import transaction
+from django.db.models import prefetch_related_objects
 from django.contrib.auth.models import User
 from rest_framework import serializers
 from .models import (
@@ -9,6 +10,13 @@ from .models import (
     ExerciseSet,
     ExerciseLog,
     UserProfile,
+    PersonalRecord,
+    exercise_tree_prefetch,
+)
+from .records import (
+    record_exercise_sets,
+    rebuild_personal_records,
+    restore_personal_records,
 )
 from datetime import date
 
@@ -60,23 +68,102 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         return instance
 
 
-class ExerciseTypeSerializer(serializers.ModelSerializer):
+def apply_changes(instance, data):
+    """
+    Sets every attribute in `data` that differs from the instance and returns
+    the names of the fields that changed.
+    """
+    changed_fields = [
+        field for field, value in data.items() if getattr(instance, field) != value
+    ]
+    for field in changed_fields:
+        setattr(instance, field, data[field])
+    return changed_fields
+
+
+class SparseFieldsMixin:
+    """
+    Renders only what the `fieldset` argument asks for (see `api.fieldsets`).
+    Expanded relations are rebuilt with their own fieldset, collapsed to-one
+    relations render as their primary key and collapsed to-many relations are
+    dropped. Without a fieldset every field is rendered.
+    """
+
+    def __init__(self, *args, fieldset=None, **kwargs):
+        self.fieldset = fieldset
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.fieldset is None:
+            return fields
+
+        sparse = {}
+        for name, field in fields.items():
+            many = isinstance(field, serializers.ListSerializer)
+            nested = field.child if many else field
+            if not isinstance(nested, serializers.BaseSerializer):
+                if self.fieldset.includes(name):
+                    sparse[name] = field
+                continue
+
+            fieldset = self.fieldset.nested(name, many=many)
+            if fieldset is not None:
+                sparse[name] = type(nested)(
+                    many=many, read_only=True, fieldset=fieldset
+                )
+            elif not many and self.fieldset.includes(name):
+                sparse[name] = serializers.PrimaryKeyRelatedField(read_only=True)
+        return sparse
+
+
+class ExerciseTypeSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = ExerciseType
         fields = ["id", "name", "muscle_group", "custom_type"]
         read_only_fields = fields
 
 
-class ExerciseSetSerializer(serializers.ModelSerializer):
+class ExerciseSetSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     id = serializers.IntegerField(required=False)
+    e1rm = serializers.DecimalField(max_digits=7, decimal_places=2, read_only=True)
+    volume = serializers.DecimalField(max_digits=8, decimal_places=2, read_only=True)
 
     class Meta:
         model = ExerciseSet
-        fields = ["id", "reps", "weight_kg", "rir"]
+        fields = ["id", "reps", "weight_kg", "rir", "e1rm", "volume"]
+
+
+class BulkPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    Resolves objects from the id lookup stored under `context_key` in the
+    serializer context when a parent serializer has loaded them in bulk, and
+    falls back to one query per value otherwise.
+    """
+
+    context_key = None
+
+    def to_internal_value(self, data):
+        objects = self.context.get(self.context_key)
+        if objects is not None:
+            try:
+                return objects[int(data)]
+            except (KeyError, TypeError, ValueError):
+                pass
+        return super().to_internal_value(data)
+
+
+class ExerciseTypeField(BulkPrimaryKeyRelatedField):
+    context_key = "exercise_types"
+
+
+class MeasurementTypeField(BulkPrimaryKeyRelatedField):
+    context_key = "measurement_types"
 
 
 class ExerciseLogWriteSerializer(serializers.ModelSerializer):
     exercise_sets = ExerciseSetSerializer(many=True)
+    exercise_type = ExerciseTypeField(queryset=ExerciseType.objects.all())
     id = serializers.IntegerField(required=False)
 
     class Meta:
@@ -84,7 +171,7 @@ class ExerciseLogWriteSerializer(serializers.ModelSerializer):
         fields = ["id", "exercise_sets", "exercise_type"]
 
 
-class ExerciseLogReadSerializer(serializers.ModelSerializer):
+class ExerciseLogReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     exercise_type = ExerciseTypeSerializer()
     exercise_sets = ExerciseSetSerializer(many=True)
 
@@ -101,21 +188,42 @@ class WorkoutLogWriteSerializer(serializers.ModelSerializer):
         fields = ["id", "begintime", "endtime", "exercise_logs"]
         read_only_fields = ["id"]
 
+    def to_internal_value(self, data):
+        # Resolve every referenced exercise type in one query up front.
+        exercise_type_ids = set()
+        exercises_data = data.get("exercise_logs") if hasattr(data, "get") else None
+        for exercise_data in exercises_data or []:
+            try:
+                exercise_type_ids.add(int(exercise_data.get("exercise_type")))
+            except (AttributeError, TypeError, ValueError):
+                continue
+        self.context["exercise_types"] = ExerciseType.objects.in_bulk(exercise_type_ids)
+        return super().to_internal_value(data)
+
     @transaction.atomic
     def create(self, validated_data):
         exercises_data = validated_data.pop("exercise_logs")
         workout_log = WorkoutLog.objects.create(**validated_data)
 
+        # One INSERT for all exercise logs and one for all sets; PostgreSQL
+        # returns the new ids, so sets can reference their logs directly.
+        sets_data = []
+        exercise_logs = []
         for exercise_data in exercises_data:
-            sets_data = exercise_data.pop("exercise_sets")
+            sets_data.append(exercise_data.pop("exercise_sets"))
             exercise_data.pop("id", None)
-            exercise_log = ExerciseLog.objects.create(
-                workout_log=workout_log, **exercise_data
-            )
+            exercise_logs.append(ExerciseLog(workout_log=workout_log, **exercise_data))
 
-            for set_data in sets_data:
+        ExerciseLog.objects.bulk_create(exercise_logs)
+
+        exercise_sets = []
+        for exercise_log, log_sets_data in zip(exercise_logs, sets_data):
+            for set_data in log_sets_data:
                 set_data.pop("id", None)
-                ExerciseSet.objects.create(exercise_log=exercise_log, **set_data)
+                exercise_sets.append(ExerciseSet(exercise_log=exercise_log, **set_data))
+
+        ExerciseSet.objects.bulk_create(exercise_sets)
+        record_exercise_sets(workout_log.user_id, exercise_sets)
 
         return workout_log
 
@@ -124,60 +232,96 @@ class WorkoutLogWriteSerializer(serializers.ModelSerializer):
         exercises_data = validated_data.pop("exercise_logs", [])
 
         # Update WorkoutLog values first
-        instance.begintime = validated_data.get("begintime", instance.begintime)
-        instance.endtime = validated_data.get("endtime", instance.endtime)
-        instance.save()
-
-        # 1. Handle Deletions (Same as before)
-        incoming_exercise_ids = [
-            item.get("id") for item in exercises_data if item.get("id") is not None
-        ]
-        existing_exercise_ids = [item.id for item in instance.exercise_logs.all()]
-
-        instance.exercise_logs.exclude(id__in=incoming_exercise_ids).delete()
+        workout_fields = apply_changes(instance, validated_data)
+        if workout_fields:
+            instance.save(update_fields=workout_fields)
+
+        # Diff the payload against one snapshot of the current tree, then
+        # apply the result with a bounded number of bulk statements.
+        prefetch_related_objects([instance], exercise_tree_prefetch())
+        existing_logs = {log.id: log for log in instance.exercise_logs.all()}
+
+        logs_to_create, logs_to_update, log_fields = [], [], set()
+        sets_to_create, sets_to_update, set_fields = [], [], set()
+        set_ids_to_delete = []
+        new_logs_sets_data = []
+        # Exercise types that lost sets, and types whose records must be
+        # recomputed because sets moved between types or changed dates.
+        removed_type_ids, rebuild_type_ids = set(), set()
 
-        # 2. Handle Create / Update
         for exercise_data in exercises_data:
             sets_data = exercise_data.pop("exercise_sets", [])
-            exercise_id = exercise_data.get("id", None)
-
-            if exercise_id in existing_exercise_ids:
-                ExerciseLog.objects.filter(id=exercise_id, workout_log=instance).update(
-                    **exercise_data
+            exercise_log = existing_logs.pop(exercise_data.pop("id", None), None)
+
+            if exercise_log is None:
+                exercise_log = ExerciseLog(workout_log=instance, **exercise_data)
+                logs_to_create.append(exercise_log)
+                new_logs_sets_data.append((exercise_log, sets_data))
+                continue
+
+            previous_type_id = exercise_log.exercise_type_id
+            changed_fields = apply_changes(exercise_log, exercise_data)
+            if changed_fields:
+                logs_to_update.append(exercise_log)
+                log_fields.update(changed_fields)
+            if previous_type_id != exercise_log.exercise_type_id:
+                rebuild_type_ids.update(
+                    [previous_type_id, exercise_log.exercise_type_id]
                 )
+            if "begintime" in workout_fields:
+                rebuild_type_ids.add(exercise_log.exercise_type_id)
 
-                current_log_id = exercise_id
-            else:
-                exercise_data.pop("id", None)
-                new_log = ExerciseLog.objects.create(
-                    workout_log=instance, **exercise_data
-                )
-                current_log_id = new_log.id
-
-            incoming_set_ids = [
-                item.get("id") for item in sets_data if item.get("id") is not None
-            ]
-
-            existing_set_ids = [
-                item.id
-                for item in ExerciseSet.objects.filter(exercise_log_id=current_log_id)
-            ]
-
-            ExerciseSet.objects.filter(exercise_log_id=current_log_id).exclude(
-                id__in=incoming_set_ids
-            ).delete()
-
+            existing_sets = {
+                exercise_set.id: exercise_set
+                for exercise_set in exercise_log.exercise_sets.all()
+            }
             for set_data in sets_data:
-                set_id = set_data.get("id", None)
-                if set_id in existing_set_ids:
-                    ExerciseSet.objects.filter(
-                        id=set_id, exercise_log_id=current_log_id
-                    ).update(**set_data)
-                else:
-                    set_data.pop("id", None)
-                    ExerciseSet.objects.create(
-                        exercise_log_id=current_log_id, **set_data
+                exercise_set = existing_sets.pop(set_data.pop("id", None), None)
+                if exercise_set is None:
+                    sets_to_create.append(
+                        ExerciseSet(exercise_log=exercise_log, **set_data)
                     )
+                    continue
+
+                changed_fields = apply_changes(exercise_set, set_data)
+                if changed_fields:
+                    sets_to_update.append(exercise_set)
+                    set_fields.update(changed_fields)
+
+            if existing_sets:
+                set_ids_to_delete.extend(existing_sets)
+                removed_type_ids.add(exercise_log.exercise_type_id)
+
+        # Logs left in the snapshot were omitted from the payload; their sets
+        # go with them through the cascade.
+        if existing_logs:
+            ExerciseLog.objects.filter(id__in=existing_logs).delete()
+            removed_type_ids.update(
+                exercise_log.exercise_type_id for exercise_log in existing_logs.values()
+            )
+        if set_ids_to_delete:
+            ExerciseSet.objects.filter(id__in=set_ids_to_delete).delete()
+        if logs_to_update:
+            ExerciseLog.objects.bulk_update(logs_to_update, log_fields)
+        if logs_to_create:
+            ExerciseLog.objects.bulk_create(logs_to_create)
+        if sets_to_update:
+            ExerciseSet.objects.bulk_update(sets_to_update, set_fields)
+
+        for exercise_log, sets_data in new_logs_sets_data:
+            for set_data in sets_data:
+                set_data.pop("id", None)
+                sets_to_create.append(
+                    ExerciseSet(exercise_log=exercise_log, **set_data)
+                )
+        if sets_to_create:
+            ExerciseSet.objects.bulk_create(sets_to_create)
+
+        # Restore records lost with their sets before promoting new ones, or
+        # a lighter new set would pass for the record of its type.
+        restore_personal_records(instance.user_id, removed_type_ids)
+        record_exercise_sets(instance.user_id, sets_to_update + sets_to_create)
+        rebuild_personal_records(instance.user_id, rebuild_type_ids)
 
         return instance
 
@@ -187,11 +331,12 @@ class WorkoutLogWriteSerializer(serializers.ModelSerializer):
         return data
 
     def to_representation(self, instance):
+        prefetch_related_objects([instance], exercise_tree_prefetch())
         serializer = WorkoutLogReadSerializer(instance)
         return serializer.data
 
 
-class WorkoutLogReadSerializer(serializers.ModelSerializer):
+class WorkoutLogReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     exercise_logs = ExerciseLogReadSerializer(many=True)
 
     class Meta:
@@ -199,13 +344,39 @@ class WorkoutLogReadSerializer(serializers.ModelSerializer):
         fields = ["id", "begintime", "endtime", "exercise_logs"]
 
 
-class MeasurementTypeSerializer(serializers.ModelSerializer):
+class ExerciseTypeSearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=100)
+    muscle_group = serializers.ChoiceField(
+        list(ExerciseType.MUSCLE_GROUPS), required=False
+    )
+    limit = serializers.IntegerField(min_value=1, max_value=50, default=10)
+
+
+class WorkoutSummarySerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    begintime = serializers.DateTimeField()
+    endtime = serializers.DateTimeField()
+    duration = serializers.DurationField()
+    exercise_count = serializers.IntegerField()
+    set_count = serializers.IntegerField()
+    total_volume = serializers.DecimalField(max_digits=12, decimal_places=2)
+
+
+class PersonalRecordSerializer(serializers.ModelSerializer):
+    exercise_type = ExerciseTypeSerializer()
+
+    class Meta:
+        model = PersonalRecord
+        fields = ["exercise_type", "weight_kg", "reps", "date"]
+
+
+class MeasurementTypeSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = MeasurementType
         fields = ["id", "name", "unit"]
 
 
-class MeasurementReadSerializer(serializers.ModelSerializer):
+class MeasurementReadSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     measurement_type = MeasurementTypeSerializer()
 
     class Meta:
@@ -213,12 +384,186 @@ class MeasurementReadSerializer(serializers.ModelSerializer):
         fields = ["id", "measurement_type", "value", "date"]
 
 
+class MeasurementBatchSerializer(serializers.ListSerializer):
+    """
+    Creates many measurements at once: every referenced measurement type is
+    resolved in one query and the measurements are upserted in one statement.
+    """
+
+    def to_internal_value(self, data):
+        measurement_type_ids = set()
+        for item in data if isinstance(data, list) else []:
+            try:
+                measurement_type_ids.add(int(item.get("measurement_type")))
+            except (AttributeError, TypeError, ValueError):
+                continue
+        self.context["measurement_types"] = MeasurementType.objects.in_bulk(
+            measurement_type_ids
+        )
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        keys = [(item["measurement_type"].id, item["date"]) for item in attrs]
+        if len(set(keys)) != len(keys):
+            raise serializers.ValidationError(
+                "Each measurement type can only be given once per date."
+            )
+        return attrs
+
+    def create(self, validated_data):
+        return Measurement.objects.upsert(
+            [Measurement(**item) for item in validated_data]
+        )
+
+
 class MeasurementWriteSerializer(serializers.ModelSerializer):
+    measurement_type = MeasurementTypeField(queryset=MeasurementType.objects.all())
+
     class Meta:
         model = Measurement
         fields = ["id", "date", "value", "measurement_type"]
         read_only_fields = ["id"]
+        list_serializer_class = MeasurementBatchSerializer
+
+    def create(self, validated_data):
+        # A measurement of a type the user already logged that day replaces it.
+        return Measurement.objects.upsert([Measurement(**validated_data)])[0]
+
+    def validate(self, data):
+        if self.instance is not None:
+            measurement_type = data.get(
+                "measurement_type", self.instance.measurement_type
+            )
+            day = data.get("date", self.instance.date)
+            if (
+                Measurement.objects.filter(
+                    user=self.instance.user_id,
+                    measurement_type=measurement_type,
+                    date=day,
+                )
+                .exclude(id=self.instance.id)
+                .exists()
+            ):
+                raise serializers.ValidationError(
+                    "A measurement of this type already exists for this date."
+                )
+        return data
 
     def to_representation(self, instance):
         serializer = MeasurementReadSerializer(instance)
         return serializer.data
+
+
+class WorkoutLogFilterSerializer(serializers.Serializer):
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    exercise_type = serializers.IntegerField(min_value=1, required=False)
+    muscle_group = serializers.ChoiceField(
+        list(ExerciseType.MUSCLE_GROUPS), required=False
+    )
+
+    def validate(self, data):
+        if "start" in data and "end" in data and data["end"] < data["start"]:
+            raise serializers.ValidationError("End date must not be before start date.")
+        return data
+
+
+class TrainingVolumeQuerySerializer(serializers.Serializer):
+    period = serializers.ChoiceField(["day", "week", "month"], default="week")
+    group_by = serializers.ChoiceField(
+        ["exercise_type", "muscle_group"], default="exercise_type"
+    )
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, data):
+        if "start" in data and "end" in data and data["end"] < data["start"]:
+            raise serializers.ValidationError("End date must not be before start date.")
+        return data
+
+
+class TrainingVolumeSerializer(serializers.Serializer):
+    period_start = serializers.DateField()
+    group = serializers.ReadOnlyField()
+    label = serializers.CharField()
+    tonnage = serializers.DecimalField(max_digits=14, decimal_places=2)
+    best_e1rm = serializers.DecimalField(max_digits=7, decimal_places=2)
+    set_count = serializers.IntegerField()
+    rep_count = serializers.IntegerField()
+    average_rir = serializers.FloatField()
+
+
+class MeasurementSeriesQuerySerializer(serializers.Serializer):
+    measurement_type = serializers.PrimaryKeyRelatedField(
+        queryset=MeasurementType.objects.all()
+    )
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    points = serializers.IntegerField(min_value=2, max_value=1000, default=200)
+
+    def validate(self, data):
+        if "start" in data and "end" in data and data["end"] < data["start"]:
+            raise serializers.ValidationError("End date must not be before start date.")
+        return data
+
+
+class MeasurementSeriesPointSerializer(serializers.Serializer):
+    date = serializers.DateField(source="first_date")
+    count = serializers.IntegerField()
+    min = serializers.DecimalField(max_digits=6, decimal_places=2)
+    max = serializers.DecimalField(max_digits=6, decimal_places=2)
+    average = serializers.DecimalField(max_digits=6, decimal_places=2)
+
+
+class WorkoutImportRowSerializer(serializers.Serializer):
+    """
+    One row of a workout history import: a set with its workout and exercise.
+    Rows with the same `workout_id` (or, without one, the same times) form one
+    workout, and rows of a workout with the same `exercise_log_id` (or,
+    without one, the same exercise type) form one exercise. Exercise types
+    are given by name and resolved from `context["exercise_types"]`.
+    """
+
+    workout_id = serializers.CharField(required=False, allow_blank=True)
+    exercise_log_id = serializers.CharField(required=False, allow_blank=True)
+    begintime = serializers.DateTimeField()
+    endtime = serializers.DateTimeField()
+    exercise_type = serializers.CharField()
+    reps = serializers.IntegerField(min_value=0, max_value=100)
+    weight_kg = serializers.DecimalField(
+        max_digits=6, decimal_places=2, min_value=0, max_value=300
+    )
+    rir = serializers.IntegerField(min_value=0, max_value=6)
+
+    def validate_exercise_type(self, value):
+        try:
+            return self.context["exercise_types"][value]
+        except KeyError:
+            raise serializers.ValidationError(f"Unknown exercise type {value!r}.")
+
+    def validate(self, data):
+        if data["endtime"] <= data["begintime"]:
+            raise serializers.ValidationError("End time must be after begin time.")
+        return data
+
+
+class MeasurementImportRowSerializer(serializers.Serializer):
+    """
+    One row of a measurement history import. Measurement types are given by
+    name and resolved from `context["measurement_types"]`.
+    """
+
+    date = serializers.DateField()
+    measurement_type = serializers.CharField()
+    value = serializers.DecimalField(max_digits=6, decimal_places=2, min_value=0)
+
+    def validate_measurement_type(self, value):
+        try:
+            return self.context["measurement_types"][value]
+        except KeyError:
+            raise serializers.ValidationError(f"Unknown measurement type {value!r}.")
+
+    def validate_date(self, value):
+        if value > date.today():
+            raise serializers.ValidationError("Date can not be in the future.")
+        return value
@@ -0,0 +1,31 @@
+from django.contrib.auth import get_user_model
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .cache import bump_catalog_version, bump_user_version
+from .timing import install_execute_wrapper
+from .models import ExerciseType, MeasurementType
+
+CATALOGS = {ExerciseType: "exercise-types", MeasurementType: "measurement-types"}
+
+
+@receiver(post_save, sender=ExerciseType)
+@receiver(post_delete, sender=ExerciseType)
+@receiver(post_save, sender=MeasurementType)
+@receiver(post_delete, sender=MeasurementType)
+def bump_catalog(sender, **kwargs):
+    # Bulk operations send no signals; bump the version by hand after them.
+    bump_catalog_version(CATALOGS[sender])
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def bump_user(sender, instance, **kwargs):
+    # Drops the user from every process's authentication cache, so deleted
+    # users and changed passwords take effect on the next request.
+    bump_user_version(instance.pk)
+
+
+@receiver(connection_created)
+def time_queries(sender, connection, **kwargs):
+    install_execute_wrapper(connection)
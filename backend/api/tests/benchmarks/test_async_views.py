@@ -0,0 +1,75 @@
+import pytest
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen
+from django.core.asgi import get_asgi_application
+from django.db import connection
+from rest_framework_simplejwt.tokens import AccessToken
+from api.tests.benchmarks.utils import median_time, report, seed_history
+
+uvicorn = pytest.importorskip("uvicorn")
+
+CLIENTS, REQUESTS = 50, 4
+
+
+@pytest.fixture
+def asgi_server_url():
+    """
+    Serves the project from uvicorn on a free local port, in a thread of the
+    test process so it sees the test database and settings.
+    """
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(
+        uvicorn.Config(get_asgi_application(), lifespan="off", log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{sock.getsockname()[1]}"
+    server.should_exit = True
+    thread.join()
+    sock.close()
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Serves from PostgreSQL.")
+def test_async_reads_outperform_sync_under_concurrent_clients(
+    user, settings, asgi_server_url
+):
+    """
+    CLIENTS concurrent clients fetch REQUESTS workout pages each from a real
+    uvicorn server, once from the sync viewset and once from the async view.
+    """
+    # Measure the views, not the response cache.
+    settings.RESPONSE_CACHE_TIMEOUT = 0
+    seed_history(user)
+    headers = {"Authorization": f"Bearer {AccessToken.for_user(user)}"}
+
+    def load(path):
+        def fetch():
+            with urlopen(Request(asgi_server_url + path, headers=headers)) as response:
+                assert response.status == 200
+                response.read()
+
+        def run():
+            with ThreadPoolExecutor(CLIENTS) as executor:
+                for future in [
+                    executor.submit(fetch) for _ in range(CLIENTS * REQUESTS)
+                ]:
+                    future.result()
+
+        return run
+
+    sync = median_time(load("/api/v1/workouts/?page_size=20"), repeat=3)
+    native = median_time(load("/api/v1/async/workouts/?page_size=20"), repeat=3)
+    report(
+        f"{CLIENTS * REQUESTS} workout pages from {CLIENTS} clients over uvicorn",
+        [("sync viewset", sync), ("async view", native)],
+    )
+    print(f"  speedup {sync / native:.1f}x")
+    assert native < sync
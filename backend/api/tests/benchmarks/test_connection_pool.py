@@ -0,0 +1,56 @@
+import psycopg
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from django.db import connection
+from psycopg_pool import ConnectionPool
+from api.tests.benchmarks.utils import median_time, report
+
+CLIENTS, REQUESTS = 8, 50
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "postgresql", reason="Connects to PostgreSQL.")
+def test_pooled_connections_cut_request_latency():
+    """
+    Simulates CLIENTS concurrent clients issuing REQUESTS requests each, where
+    a request gets a connection, runs one query and gives it back.
+    """
+    params = connection.get_connection_params()
+    params.pop("cursor_factory", None)
+    params.pop("context", None)
+
+    def unpooled_request():
+        with psycopg.connect(**params) as conn:
+            conn.execute("SELECT 1").fetchone()
+
+    def load(request):
+        def run():
+            with ThreadPoolExecutor(CLIENTS) as executor:
+                for future in [
+                    executor.submit(request) for _ in range(CLIENTS * REQUESTS)
+                ]:
+                    future.result()
+
+        return run
+
+    with ConnectionPool(kwargs=params, min_size=CLIENTS, max_size=CLIENTS) as pool:
+        pool.wait()
+
+        def pooled_request():
+            with pool.connection() as conn:
+                conn.execute("SELECT 1").fetchone()
+
+        unpooled = median_time(load(unpooled_request), repeat=3)
+        pooled = median_time(load(pooled_request), repeat=3)
+
+    requests = CLIENTS * REQUESTS
+    report(
+        f"{requests} requests from {CLIENTS} clients",
+        [("new connection", unpooled), ("pooled connection", pooled)],
+    )
+    print(
+        f"  per request {unpooled / requests * 1000:.2f} ms"
+        f" -> {pooled / requests * 1000:.2f} ms"
+    )
+    assert pooled < unpooled
@@ -0,0 +1,35 @@
+import pytest
+from rest_framework.renderers import JSONRenderer
+from api.models import WorkoutLog
+from api.readers import WorkoutLogReader
+from api.serializers import WorkoutLogReadSerializer
+from api.tests.benchmarks.utils import median_time, report, seed_history
+
+WORKOUTS, EXERCISES, SETS = 200, 10, 6  # 12,000 sets
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_fast_reader_outperforms_serializers(user):
+    seed_history(user, WORKOUTS, EXERCISES, SETS)
+    workouts = WorkoutLog.objects.filter(user=user).order_by("-begintime", "-id")
+    renderer = JSONRenderer()
+
+    def serializer_path():
+        queryset = workouts.with_exercise_tree()
+        return renderer.render(WorkoutLogReadSerializer(queryset, many=True).data)
+
+    def fast_path():
+        rows = list(WorkoutLogReader.values(workouts))
+        return renderer.render(WorkoutLogReader.render(rows))
+
+    assert fast_path() == serializer_path()
+
+    slow = median_time(serializer_path, repeat=3)
+    fast = median_time(fast_path, repeat=3)
+    report(
+        f"Render {WORKOUTS * EXERCISES * SETS} sets",
+        [("WorkoutLogReadSerializer", slow), ("WorkoutLogReader", fast)],
+    )
+    print(f"  speedup {slow / fast:.1f}x")
+    assert fast < slow
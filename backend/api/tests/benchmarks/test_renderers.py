@@ -0,0 +1,27 @@
+import pytest
+from rest_framework.renderers import JSONRenderer
+from api.models import WorkoutLog
+from api.readers import WorkoutLogReader
+from api.renderers import ORJSONRenderer
+from api.tests.benchmarks.test_read_paths import SETS, EXERCISES, WORKOUTS
+from api.tests.benchmarks.utils import median_time, report, seed_history
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_orjson_renderer_outperforms_drf_renderer(user):
+    seed_history(user, WORKOUTS, EXERCISES, SETS)
+    workouts = WorkoutLog.objects.filter(user=user).order_by("-begintime", "-id")
+    data = WorkoutLogReader.render(list(WorkoutLogReader.values(workouts)))
+    drf_renderer, orjson_renderer = JSONRenderer(), ORJSONRenderer()
+
+    assert orjson_renderer.render(data) == drf_renderer.render(data)
+
+    slow = median_time(lambda: drf_renderer.render(data))
+    fast = median_time(lambda: orjson_renderer.render(data))
+    report(
+        f"Render {WORKOUTS * EXERCISES * SETS} sets to JSON",
+        [("JSONRenderer", slow), ("ORJSONRenderer", fast)],
+    )
+    print(f"  speedup {slow / fast:.1f}x")
+    assert fast < slow
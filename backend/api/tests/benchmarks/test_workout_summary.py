@@ -0,0 +1,48 @@
+import pytest
+from datetime import timedelta
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+from api.models import WorkoutLog
+from api.readers import WorkoutLogReader
+from api.serializers import WorkoutSummarySerializer
+from api.tests.benchmarks.utils import median_time, report, seed_history
+
+WORKOUTS, EXERCISES, SETS = 3000, 4, 4  # 48,000 sets
+PAGE_SIZE = 50
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_summary_page_outperforms_full_tree(user):
+    seed_history(
+        user,
+        WORKOUTS,
+        EXERCISES,
+        SETS,
+        interval=timedelta(hours=12),
+        duration=timedelta(minutes=75),
+    )
+    workouts = WorkoutLog.objects.filter(user=user).order_by("-begintime", "-id")
+    renderer = JSONRenderer()
+
+    def full_tree():
+        rows = list(WorkoutLogReader.values(workouts[:PAGE_SIZE]))
+        return renderer.render(WorkoutLogReader.render(rows))
+
+    def summary():
+        rows = workouts.summaries()[:PAGE_SIZE]
+        return renderer.render(WorkoutSummarySerializer(rows, many=True).data)
+
+    with CaptureQueriesContext(connection) as queries:
+        summary()
+    assert len(queries) == 1
+
+    slow = median_time(full_tree)
+    fast = median_time(summary)
+    report(
+        f"Page of {PAGE_SIZE} out of {WORKOUTS} workouts",
+        [("full exercise tree", slow), ("summary", fast)],
+    )
+    print(f"  speedup {slow / fast:.1f}x")
+    assert fast < slow
@@ -0,0 +1,55 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from api.tests.factories import ExerciseTypeFactory
+from api.tests.benchmarks.utils import median_time, report
+
+EXERCISES = 10
+
+
+def workout_payload(exercise_types, sets_per_exercise, weight_kg=100.0):
+    begintime = timezone.now()
+    return {
+        "begintime": begintime.isoformat(),
+        "endtime": (begintime + timezone.timedelta(hours=1)).isoformat(),
+        "exercise_logs": [
+            {
+                "exercise_type": exercise_type.id,
+                "exercise_sets": [
+                    {"reps": 5, "weight_kg": weight_kg, "rir": 2}
+                    for _ in range(sets_per_exercise)
+                ],
+            }
+            for exercise_type in exercise_types
+        ],
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.django_db
+def test_workout_create_latency_is_flat_in_set_count(api_client, assert_status):
+    exercise_types = ExerciseTypeFactory.create_batch(EXERCISES)
+    rows = []
+    query_counts = set()
+
+    # Hold heavier records up front, so that no measured POST promotes a set
+    # and every one runs the same statements.
+    payload = workout_payload(exercise_types, 1, weight_kg=200.0)
+    assert_status(api_client.post("/api/v1/workouts/", payload, format="json"), 201)
+
+    for sets_per_exercise in (1, 4, 16, 32):
+        payload = workout_payload(exercise_types, sets_per_exercise)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.post("/api/v1/workouts/", payload, format="json")
+        assert_status(response, 201)
+        query_counts.add(len(queries))
+
+        seconds = median_time(
+            lambda: api_client.post("/api/v1/workouts/", payload, format="json")
+        )
+        rows.append((f"{EXERCISES * sets_per_exercise} sets", seconds))
+
+    report("POST /api/v1/workouts/", rows)
+    assert len(query_counts) == 1, "Statement count grows with the number of sets"
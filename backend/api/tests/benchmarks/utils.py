@@ -0,0 +1,66 @@
+import statistics
+import time
+from datetime import timedelta
+from django.db import connection
+from django.utils import timezone
+from api.models import ExerciseLog, ExerciseSet, WorkoutLog
+from api.tests.factories import ExerciseTypeFactory
+
+
+def median_time(func, repeat=5):
+    """
+    Calls `func` `repeat` times and returns the median wall time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def report(title, rows):
+    """
+    Prints a small aligned table of (label, seconds) rows; run with `-s`.
+    """
+    print(f"\n{title}")
+    for label, seconds in rows:
+        print(f"  {label:<24} {seconds * 1000:8.2f} ms")
+
+
+def seed_history(
+    user,
+    workouts=200,
+    exercises=10,
+    sets=6,
+    interval=timedelta(days=1),
+    duration=timedelta(minutes=60),
+):
+    """
+    Bulk-creates a training history for `user`: `workouts` workouts, one
+    every `interval` going back from now, each with a log of `exercises`
+    exercise types holding `sets` identical sets. Planner statistics are
+    refreshed afterwards, as they would be on a live database.
+    """
+    exercise_types = ExerciseTypeFactory.create_batch(exercises)
+    now = timezone.now()
+    workout_logs = WorkoutLog.objects.bulk_create(
+        WorkoutLog(
+            user=user,
+            begintime=now - interval * index,
+            endtime=now - interval * index + duration,
+        )
+        for index in range(workouts)
+    )
+    exercise_logs = ExerciseLog.objects.bulk_create(
+        ExerciseLog(workout_log=workout_log, exercise_type=exercise_type)
+        for workout_log in workout_logs
+        for exercise_type in exercise_types
+    )
+    ExerciseSet.objects.bulk_create(
+        ExerciseSet(exercise_log=exercise_log, reps=8, weight_kg="82.50", rir=2)
+        for exercise_log in exercise_logs
+        for _ in range(sets)
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
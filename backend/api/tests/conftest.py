@@ -1,10 +1,17 @@
 import pytest
 import json
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from django.contrib.auth.models import User
 from api.models import ExerciseType
 
 
+# 0. Start every test with an empty cache; ids are reused between tests
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
 # 1. Create a reusable User fixture
 @pytest.fixture
 def user(db):
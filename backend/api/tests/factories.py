@@ -28,16 +28,17 @@ class ExerciseTypeFactory(factory.django.DjangoModelFactory):
         model = ExerciseType
 
     name = factory.Sequence(lambda n: f"Exercise {n}")
+    muscle_group = "CHEST"
+    custom_type = False
 
 
-class ExerciseSetFactory(factory.django.DjangoModelFactory):
+class WorkoutLogFactory(factory.django.DjangoModelFactory):
     class Meta:
-        model = ExerciseSet
+        model = WorkoutLog
 
-    reps = 5
-    weight_kg = "60.00"
-    rpe = 8
-    rir = 2
+    user = factory.SubFactory(UserFactory)
+    begintime = factory.LazyFunction(timezone.now)
+    endtime = factory.LazyFunction(lambda: timezone.now() + timezone.timedelta(hours=1))
 
 
 class ExerciseLogFactory(factory.django.DjangoModelFactory):
@@ -45,17 +46,17 @@ class ExerciseLogFactory(factory.django.DjangoModelFactory):
         model = ExerciseLog
 
     exercise_type = factory.SubFactory(ExerciseTypeFactory)
-    exercise_sets = factory.SubFactory(ExerciseSetFactory)
+    workout_log = factory.SubFactory(WorkoutLogFactory)
 
 
-class WorkoutLogFactory(factory.django.DjangoModelFactory):
+class ExerciseSetFactory(factory.django.DjangoModelFactory):
     class Meta:
-        model = WorkoutLog
+        model = ExerciseSet
 
-    user = factory.SubFactory(UserFactory)
-    begintime = factory.LazyFunction(timezone.now)
-    endtime = factory.LazyFunction(lambda: timezone.now() + timezone.timedelta(hours=1))
-    exercise_logs = [factory.SubFactory(ExerciseLogFactory)]
+    exercise_log = factory.SubFactory(ExerciseLogFactory)
+    reps = 5
+    weight_kg = "60.00"
+    rir = 2
 
 
 class MeasurementTypeFactory(factory.django.DjangoModelFactory):
@@ -0,0 +1,74 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from api.tests.factories import (
+    ExerciseLogFactory,
+    ExerciseSetFactory,
+    WorkoutLogFactory,
+)
+
+
+def log_sets(user, exercise_type, begintime, sets):
+    workout = WorkoutLogFactory(
+        user=user, begintime=begintime, endtime=begintime + timedelta(hours=1)
+    )
+    exercise_log = ExerciseLogFactory(workout_log=workout, exercise_type=exercise_type)
+    for reps, weight_kg, rir in sets:
+        ExerciseSetFactory(
+            exercise_log=exercise_log, reps=reps, weight_kg=weight_kg, rir=rir
+        )
+
+
+@pytest.mark.django_db
+def test_weekly_volume_per_exercise_type(
+    api_client, user, bench_press, squat, assert_status, django_assert_num_queries
+):
+    monday = datetime(2026, 3, 2, 10, tzinfo=timezone.utc)
+    log_sets(user, bench_press, monday, [(10, 100, 2), (8, 100, 1)])
+    log_sets(user, squat, monday + timedelta(days=2), [(5, 140, 3)])
+    log_sets(user, bench_press, monday + timedelta(days=7), [(5, 110, 0)])
+    # Outside the requested range.
+    log_sets(user, bench_press, monday - timedelta(days=30), [(5, 50, 0)])
+
+    with django_assert_num_queries(1):
+        response = api_client.get(
+            "/api/v1/analytics/volume/",
+            {"period": "week", "start": "2026-03-01", "end": "2026-03-15"},
+        )
+
+    assert_status(response, 200)
+    assert [
+        (row["period_start"], row["label"], row["tonnage"], row["set_count"])
+        for row in response.data
+    ] == [
+        ("2026-03-02", "Bench Press", "1800.00", 2),
+        ("2026-03-02", "Squat", "700.00", 1),
+        ("2026-03-09", "Bench Press", "550.00", 1),
+    ]
+    assert response.data[0]["rep_count"] == 18
+    # 100 kg for 10 reps with 2 in reserve: 100 * (30 + 12) / 30
+    assert response.data[0]["best_e1rm"] == "140.00"
+    assert response.data[0]["average_rir"] == 1.5
+
+
+@pytest.mark.django_db
+def test_monthly_volume_per_muscle_group(api_client, user, bench_press, squat):
+    day = datetime(2026, 3, 2, 10, tzinfo=timezone.utc)
+    log_sets(user, bench_press, day, [(10, 100, 2)])
+    log_sets(user, squat, day, [(5, 100, 2)])
+
+    response = api_client.get(
+        "/api/v1/analytics/volume/", {"period": "month", "group_by": "muscle_group"}
+    )
+
+    assert [(row["group"], row["label"]) for row in response.data] == [
+        ("CHEST", "Chest"),
+        ("QUAD", "Quad"),
+    ]
+    assert {row["period_start"] for row in response.data} == {"2026-03-01"}
+
+
+@pytest.mark.django_db
+def test_volume_rejects_unknown_period(api_client, assert_status):
+    response = api_client.get("/api/v1/analytics/volume/", {"period": "year"})
+
+    assert_status(response, 400)
@@ -0,0 +1,102 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from django.test import Client
+from rest_framework_simplejwt.tokens import AccessToken
+from api.tests.factories import (
+    ExerciseLogFactory,
+    ExerciseSetFactory,
+    MeasurementFactory,
+    MeasurementTypeFactory,
+    WorkoutLogFactory,
+)
+
+
+@pytest.fixture
+def client(user):
+    return Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+
+@pytest.fixture
+def history(user, bench_press, squat):
+    begintime = datetime(2026, 1, 5, 7, 30, tzinfo=timezone.utc)
+    for day in range(5):
+        workout = WorkoutLogFactory(
+            user=user,
+            begintime=begintime + timedelta(days=day),
+            endtime=begintime + timedelta(days=day, hours=1),
+        )
+        for exercise_type in (bench_press, squat)[: day % 2 + 1]:
+            exercise_log = ExerciseLogFactory(
+                workout_log=workout, exercise_type=exercise_type
+            )
+            ExerciseSetFactory.create_batch(2, exercise_log=exercise_log)
+    measurement_type = MeasurementTypeFactory()
+    for day in range(3):
+        MeasurementFactory(
+            user=user,
+            measurement_type=measurement_type,
+            date=date(2026, 2, 1) + timedelta(days=day),
+        )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "path",
+    [
+        "workouts/?page_size=2",
+        "workouts/?fields=begintime,exercise_logs.exercise_type.name",
+        "workouts/?muscle_group=QUAD&start=2026-01-06",
+        "measurements/?page_size=2&expand=measurement_type",
+        "exercise-types/",
+        "measurement-types/",
+    ],
+)
+def test_async_reads_match_sync_endpoints(
+    client, api_client, history, assert_status, path
+):
+    sync = api_client.get(f"/api/v1/{path}")
+    response = client.get(f"/api/v1/async/{path}")
+
+    assert_status(sync, 200)
+    assert response.status_code == 200
+    # Only the path in the cursor links differs.
+    assert response.content == sync.content.replace(b"/api/v1/", b"/api/v1/async/")
+    assert response["ETag"] == sync["ETag"]
+
+
+@pytest.mark.django_db
+def test_async_cursor_walks_every_page(client, history):
+    ids, url = [], "/api/v1/async/workouts/?page_size=2"
+    while url:
+        page = client.get(url).json()
+        ids += [workout["id"] for workout in page["results"]]
+        url = page["next"]
+
+    assert len(ids) == 5
+    assert ids == sorted(ids, reverse=True)
+
+
+@pytest.mark.django_db
+def test_async_reads_answer_matching_etag_with_304(client, history):
+    etag = client.get("/api/v1/async/measurements/")["ETag"]
+
+    response = client.get("/api/v1/async/measurements/", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_async_reads_reject_missing_or_bad_tokens(client, history):
+    anonymous = Client().get("/api/v1/async/workouts/")
+    assert anonymous.status_code == 401
+    assert anonymous["WWW-Authenticate"] == 'Bearer realm="api"'
+
+    forged = Client(HTTP_AUTHORIZATION="Bearer not-a-token").get(
+        "/api/v1/async/workouts/"
+    )
+    assert forged.status_code == 401
+    assert forged.json()["code"] == "token_not_valid"
+
+    assert client.get("/api/v1/async/workouts/?start=never").status_code == 400
+    # The catalogs are public.
+    assert Client().get("/api/v1/async/exercise-types/").status_code == 200
@@ -0,0 +1,75 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from api import authentication
+from api.tests.factories import WorkoutLogFactory
+
+
+@pytest.fixture(autouse=True)
+def shared_cache(monkeypatch):
+    # The tests run on the local memory cache; act as if it were shared.
+    monkeypatch.setattr(authentication, "is_shared_cache", lambda: True)
+
+
+@pytest.fixture
+def token_client(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    return client
+
+
+def user_queries(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return [query["sql"] for query in queries if '"auth_user"' in query["sql"]]
+
+
+@pytest.mark.django_db
+def test_cached_user_is_not_loaded_on_every_request(token_client, user):
+    WorkoutLogFactory(user=user)
+
+    assert len(user_queries(token_client, "/api/v1/workouts/")) == 1
+    assert user_queries(token_client, "/api/v1/workouts/") == []
+    assert user_queries(token_client, "/api/v1/async/workouts/") == []
+
+
+@pytest.mark.django_db
+def test_per_process_cache_loads_user_on_every_request(monkeypatch, token_client, user):
+    monkeypatch.setattr(authentication, "is_shared_cache", lambda: False)
+
+    assert len(user_queries(token_client, "/api/v1/workouts/")) == 1
+    assert len(user_queries(token_client, "/api/v1/workouts/")) == 1
+    assert len(user_queries(token_client, "/api/v1/async/workouts/")) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/api/v1/auth/users/me/", "/api/v1/auth/users/{}/"])
+def test_deleted_user_token_stops_working(token_client, user, assert_status, url):
+    assert_status(token_client.get("/api/v1/workouts/"), 200)
+
+    assert_status(token_client.delete(url.format(user.id)), 204)
+
+    response = token_client.get("/api/v1/workouts/")
+    assert_status(response, 401)
+    assert response.data["detail"].code == "user_not_found"
+
+
+@pytest.mark.django_db
+def test_password_change_revokes_earlier_tokens(token_client, user, assert_status):
+    assert_status(token_client.get("/api/v1/workouts/"), 200)
+
+    response = token_client.patch(
+        "/api/v1/auth/users/me/", {"password": "a-new-password"}, format="json"
+    )
+    assert_status(response, 200)
+
+    response = token_client.get("/api/v1/workouts/")
+    assert_status(response, 401)
+    assert response.data["detail"].code == "password_changed"
+
+    user.refresh_from_db()
+    token_client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    assert_status(token_client.get("/api/v1/workouts/"), 200)
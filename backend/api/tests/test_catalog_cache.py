@@ -0,0 +1,71 @@
+import pytest
+import time
+from rest_framework.test import APIClient
+from api.models import ExerciseType
+from api.tests.factories import ExerciseTypeFactory, MeasurementTypeFactory
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url, factory",
+    [
+        ("/api/v1/exercise-types/", ExerciseTypeFactory),
+        ("/api/v1/measurement-types/", MeasurementTypeFactory),
+    ],
+)
+def test_catalog_is_served_from_memory_until_the_table_changes(
+    url, factory, assert_status, django_assert_num_queries
+):
+    client = APIClient()
+    factory.create_batch(3)
+
+    response = client.get(url)
+    assert_status(response, 200)
+    assert len(response.data) == 3
+    etag = response["ETag"]
+    assert not etag.startswith("W/")
+    assert "public" in response["Cache-Control"]
+    assert "max-age=86400" in response["Cache-Control"]
+
+    with django_assert_num_queries(0):
+        assert client.get(url).content == response.content
+        assert_status(client.get(url, HTTP_IF_NONE_MATCH=etag), 304)
+
+    factory()
+    response = client.get(url)
+    assert len(response.data) == 4
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_deleting_an_exercise_type_invalidates_the_catalog(assert_status):
+    client = APIClient()
+    exercise_type = ExerciseTypeFactory()
+    etag = client.get("/api/v1/exercise-types/")["ETag"]
+
+    exercise_type.delete()
+    response = client.get("/api/v1/exercise-types/", HTTP_IF_NONE_MATCH=etag)
+
+    assert_status(response, 200)
+    assert response.data == []
+
+
+@pytest.mark.django_db
+def test_catalog_expires_for_changes_without_a_version_bump(
+    monkeypatch, settings, assert_status
+):
+    client = APIClient()
+    exercise_type = ExerciseTypeFactory(name="Bench")
+    etag = client.get("/api/v1/exercise-types/")["ETag"]
+
+    # Queryset updates send no signals, like changes a per-process cache
+    # keeps from this worker.
+    ExerciseType.objects.filter(id=exercise_type.id).update(name="Bench Press")
+    assert_status(client.get("/api/v1/exercise-types/", HTTP_IF_NONE_MATCH=etag), 304)
+
+    expired = time.monotonic() + settings.CATALOG_CACHE_TIMEOUT + 1
+    monkeypatch.setattr(time, "monotonic", lambda: expired)
+    response = client.get("/api/v1/exercise-types/", HTTP_IF_NONE_MATCH=etag)
+    assert_status(response, 200)
+    assert response.data[0]["name"] == "Bench Press"
+    assert response["ETag"] != etag
@@ -0,0 +1,56 @@
+import pytest
+import runpy
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from api.tests.factories import MeasurementTypeFactory
+
+
+@pytest.mark.django_db
+def test_unchanged_collection_returns_304_without_queries(
+    api_client, assert_status, django_assert_num_queries
+):
+    response = api_client.get("/api/v1/workouts/")
+    assert_status(response, 200)
+    etag = response["ETag"]
+
+    with django_assert_num_queries(0):
+        response = api_client.get("/api/v1/workouts/", HTTP_IF_NONE_MATCH=etag)
+
+    assert_status(response, 304)
+    assert response.content == b""
+    assert response["ETag"] == etag
+
+
+@pytest.mark.django_db
+def test_writes_change_the_etag(api_client, user, assert_status):
+    etag = api_client.get("/api/v1/measurements/")["ETag"]
+
+    response = api_client.post(
+        "/api/v1/measurements/",
+        {
+            "measurement_type": MeasurementTypeFactory().id,
+            "value": "80.50",
+            "date": timezone.localdate().isoformat(),
+        },
+        format="json",
+    )
+    assert_status(response, 201)
+
+    response = api_client.get("/api/v1/measurements/", HTTP_IF_NONE_MATCH=etag)
+    assert_status(response, 200)
+    assert response["ETag"] != etag
+    assert len(response.data["results"]) == 1
+
+    # Workouts share the same per-user version.
+    assert api_client.get("/api/v1/workouts/")["ETag"] == response["ETag"]
+
+
+def test_workers_refuse_a_per_process_cache(monkeypatch):
+    # Data versions in a per-process cache would not reach the other workers.
+    monkeypatch.setenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache")
+    monkeypatch.setenv("WEB_CONCURRENCY", "2")
+    with pytest.raises(ImproperlyConfigured):
+        runpy.run_module("backend.settings")
+
+    monkeypatch.setenv("CACHE_BACKEND", "django.core.cache.backends.redis.RedisCache")
+    assert runpy.run_module("backend.settings")["WEB_CONCURRENCY"] == 2
@@ -0,0 +1,58 @@
+import pytest
+import runpy
+from django.contrib.auth.models import User
+from django.db import connection
+from rest_framework.test import APIClient
+
+
+def database_settings(monkeypatch, **env):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    return runpy.run_module("backend.settings")["DATABASES"]["default"]
+
+
+def test_pool_is_configured_from_the_environment(monkeypatch):
+    database = database_settings(
+        monkeypatch, DB_POOL="1", DB_POOL_MIN_SIZE="4", DB_POOL_MAX_SIZE="16"
+    )
+
+    assert database["OPTIONS"]["pool"]["min_size"] == 4
+    assert database["OPTIONS"]["pool"]["max_size"] == 16
+    assert database["CONN_HEALTH_CHECKS"] is True
+    # Django refuses pools combined with persistent connections.
+    assert database.get("CONN_MAX_AGE", 0) == 0
+    assert "prepare_threshold" not in database["OPTIONS"]
+
+
+def test_unpooled_connections_persist_and_prepared_statements_are_opt_in(
+    monkeypatch,
+):
+    database = database_settings(
+        monkeypatch,
+        DB_POOL="0",
+        DB_CONN_MAX_AGE="120",
+        DB_PREPARED_STATEMENTS="1",
+        DB_PREPARE_THRESHOLD="2",
+    )
+
+    assert "pool" not in database["OPTIONS"]
+    assert database["CONN_MAX_AGE"] == 120
+    assert database["OPTIONS"]["server_side_binding"] is True
+    assert database["OPTIONS"]["prepare_threshold"] == 2
+
+
+@pytest.mark.django_db
+def test_pool_stats_are_admin_only(api_client, assert_status):
+    assert_status(api_client.get("/api/v1/stats/connection-pool/"), 403)
+
+    admin_client = APIClient()
+    admin_client.force_authenticate(
+        User.objects.create_user(username="admin", is_staff=True)
+    )
+    response = admin_client.get("/api/v1/stats/connection-pool/")
+
+    assert_status(response, 200)
+    pooled = getattr(connection, "pool", None) is not None
+    assert response.data["pooled"] is pooled
+    if pooled:
+        assert {"pool_min", "pool_max", "pool_size"} <= set(response.data)
@@ -0,0 +1,63 @@
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+from api.tests.factories import ExerciseTypeFactory
+
+
+# Searching runs trigram lookups of pg_trgm.
+postgresql_only = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Searches with pg_trgm."
+)
+
+
+@pytest.fixture
+def catalog(db):
+    for name, muscle_group in [
+        ("Bench Press", "CHEST"),
+        ("Incline Bench Press", "CHEST"),
+        ("Dumbbell Bench Press", "CHEST"),
+        ("Bent Over Row", "BACK"),
+        ("Squat", "QUAD"),
+    ]:
+        ExerciseTypeFactory(name=name, muscle_group=muscle_group)
+
+
+def search(**params):
+    response = APIClient().get("/api/v1/exercise-types/search/", params)
+    assert response.status_code == 200, response.data
+    return [exercise_type["name"] for exercise_type in response.data]
+
+
+@postgresql_only
+def test_prefix_matches_rank_first(catalog):
+    names = search(q="ben")
+
+    assert names[:2] == ["Bench Press", "Bent Over Row"]
+    assert set(names[2:]) == {"Dumbbell Bench Press", "Incline Bench Press"}
+
+
+@postgresql_only
+def test_muscle_group_filter_and_limit(catalog):
+    assert search(q="bench", muscle_group="CHEST", limit=2) == [
+        "Bench Press",
+        # Ties between non-prefix matches are broken by name.
+        "Dumbbell Bench Press",
+    ]
+    assert search(q="bench", muscle_group="BACK") == []
+
+
+@postgresql_only
+def test_typos_still_match(catalog):
+    assert search(q="bech press") == [
+        "Bench Press",
+        "Dumbbell Bench Press",
+        "Incline Bench Press",
+    ]
+
+
+@pytest.mark.django_db
+def test_query_is_validated():
+    response = APIClient().get("/api/v1/exercise-types/search/", {"limit": 500})
+
+    assert response.status_code == 400
+    assert set(response.data) == {"q", "limit"}
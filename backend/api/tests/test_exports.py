@@ -0,0 +1,119 @@
+import csv
+import io
+import json
+import pytest
+from asgiref.sync import async_to_sync
+from datetime import date, datetime, timedelta, timezone
+from django.contrib.auth.models import User
+from django.test import AsyncClient
+from rest_framework_simplejwt.tokens import AccessToken
+from rest_framework.test import APIClient
+from api.tests.factories import (
+    ExerciseLogFactory,
+    ExerciseSetFactory,
+    MeasurementFactory,
+    MeasurementTypeFactory,
+    WorkoutLogFactory,
+)
+
+
+@pytest.fixture
+def history(user, bench_press, squat):
+    begintime = datetime(2026, 1, 5, 7, 30, tzinfo=timezone.utc)
+    for day, exercise_type in enumerate([squat, bench_press]):
+        workout = WorkoutLogFactory(
+            user=user,
+            begintime=begintime + timedelta(days=day),
+            endtime=begintime + timedelta(days=day, hours=1),
+        )
+        exercise_log = ExerciseLogFactory(
+            workout_log=workout, exercise_type=exercise_type
+        )
+        for reps in (5, 8):
+            ExerciseSetFactory(
+                exercise_log=exercise_log, reps=reps, weight_kg="82.50", rir=2
+            )
+
+    bodyweight = MeasurementTypeFactory(name="Bodyweight", unit="kg")
+    for day, value in enumerate(("81.40", "81.20")):
+        MeasurementFactory(
+            user=user,
+            measurement_type=bodyweight,
+            value=value,
+            date=date(2026, 1, 5) + timedelta(days=day),
+        )
+
+    # Someone else's history must not leak into the export.
+    other = User.objects.create_user(username="other", password="password")
+    ExerciseSetFactory(exercise_log__workout_log__user=other)
+    MeasurementFactory(user=other, measurement_type=bodyweight)
+
+
+def read_stream(response):
+    return b"".join(response.streaming_content).decode()
+
+
+@pytest.mark.django_db
+def test_workout_export_streams_one_ndjson_row_per_set(api_client, history):
+    response = api_client.get("/api/v1/export/workouts/")
+
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in read_stream(response).splitlines()]
+    assert [(row["exercise_type"], row["reps"]) for row in rows] == [
+        ("Squat", 5),
+        ("Squat", 8),
+        ("Bench Press", 5),
+        ("Bench Press", 8),
+    ]
+    assert rows[0]["begintime"] == "2026-01-05T07:30:00Z"
+    assert rows[0]["muscle_group"] == "QUAD"
+    assert rows[1]["weight_kg"] == "82.50"
+    assert rows[1]["volume"] == "660.00"
+    assert rows[1]["e1rm"] == "110.00"
+
+
+@pytest.mark.django_db
+def test_measurement_export_streams_csv(api_client, history):
+    response = api_client.get("/api/v1/export/measurements/?format=csv")
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/csv; charset=utf-8"
+    assert 'filename="measurements.csv"' in response["Content-Disposition"]
+    rows = list(csv.reader(io.StringIO(read_stream(response))))
+    assert rows[0] == [
+        "measurement_id",
+        "date",
+        "measurement_type_id",
+        "measurement_type",
+        "unit",
+        "value",
+    ]
+    assert [row[1:] for row in rows[1:]] == [
+        ["2026-01-05", rows[1][2], "Bodyweight", "kg", "81.40"],
+        ["2026-01-06", rows[1][2], "Bodyweight", "kg", "81.20"],
+    ]
+
+
+@pytest.mark.django_db
+def test_export_requires_authentication_and_answers_in_kind():
+    response = APIClient().get("/api/v1/export/workouts/", HTTP_ACCEPT="text/csv")
+
+    assert response.status_code == 401
+    assert response.content.decode().splitlines()[0] == "detail"
+
+
+@pytest.mark.django_db
+def test_export_streams_asynchronously_under_asgi(user, history):
+    # Sync content would be read whole by the ASGI handler before sending.
+    async def export():
+        response = await AsyncClient().get(
+            "/api/v1/export/workouts/",
+            headers={"Authorization": f"Bearer {AccessToken.for_user(user)}"},
+        )
+        assert response.is_async
+        return [chunk async for chunk in response.streaming_content]
+
+    content = b"".join(async_to_sync(export)()).decode()
+    assert len(content.splitlines()) == 4
@@ -0,0 +1,126 @@
+import json
+import pytest
+from datetime import date, timedelta
+from decimal import Decimal
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from api.models import ExerciseSet, Measurement, PersonalRecord, WorkoutLog
+from api.tests.factories import MeasurementTypeFactory
+
+WORKOUT_CSV = """\
+workout_id,begintime,endtime,exercise_type,reps,weight_kg,rir
+1,2026-01-05T07:30:00Z,2026-01-05T08:30:00Z,Squat,5,120.00,2
+1,2026-01-05T07:30:00Z,2026-01-05T08:30:00Z,Squat,5,125.00,1
+1,2026-01-05T07:30:00Z,2026-01-05T08:30:00Z,Bench Press,8,80.00,2
+1,2026-01-05T07:30:00Z,2026-01-05T08:30:00Z,Deadlift,5,160.00,2
+2,2026-01-07T07:30:00Z,2026-01-07T08:30:00Z,Squat,101,100.00,2
+2,2026-01-07T07:30:00Z,2026-01-07T08:30:00Z,Squat,5,130.00,2
+2,2026-01-08T07:30:00Z,2026-01-08T08:30:00Z,Squat,5,90.00,2
+"""
+
+
+@pytest.mark.django_db
+def test_workout_csv_import_skips_invalid_rows(
+    api_client, user, bench_press, squat, django_assert_max_num_queries
+):
+    with django_assert_max_num_queries(12):
+        response = api_client.post(
+            "/api/v1/import/workouts/", WORKOUT_CSV, content_type="text/csv"
+        )
+
+    assert response.status_code == 201
+    assert response.data["imported"] == {
+        "workouts": 2,
+        "exercise_logs": 3,
+        "exercise_sets": 4,
+    }
+    assert [error["row"] for error in response.data["errors"]] == [4, 5, 7]
+    assert "Unknown exercise type" in str(response.data["errors"][0]["errors"])
+    assert "reps" in response.data["errors"][1]["errors"]
+
+    assert WorkoutLog.objects.filter(user=user).count() == 2
+    assert ExerciseSet.objects.filter(exercise_log__workout_log__user=user).count() == 4
+    records = {
+        record.exercise_type_id: record.weight_kg
+        for record in PersonalRecord.objects.filter(user=user)
+    }
+    assert records == {squat.id: 130, bench_press.id: 80}
+
+
+@pytest.mark.django_db
+def test_exported_workouts_import_back(api_client, user, squat):
+    api_client.post("/api/v1/import/workouts/", WORKOUT_CSV, content_type="text/csv")
+    export = b"".join(api_client.get("/api/v1/export/workouts/").streaming_content)
+
+    other = User.objects.create_user(username="other", password="password")
+    client = APIClient()
+    client.force_authenticate(user=other)
+    response = client.post(
+        "/api/v1/import/workouts/", export, content_type="application/x-ndjson"
+    )
+
+    assert response.status_code == 201
+    assert response.data["errors"] == []
+    assert response.data["imported"] == {
+        "workouts": 2,
+        "exercise_logs": 2,
+        "exercise_sets": 3,
+    }
+
+
+@pytest.mark.django_db
+def test_measurement_ndjson_import_reports_bad_lines(api_client, user):
+    MeasurementTypeFactory(name="Bodyweight")
+    tomorrow = date.today() + timedelta(days=1)
+    body = "\n".join(
+        [
+            json.dumps(
+                {
+                    "date": "2026-01-05",
+                    "measurement_type": "Bodyweight",
+                    "value": "81.40",
+                }
+            ),
+            "{not json",
+            json.dumps(
+                {
+                    "date": tomorrow.isoformat(),
+                    "measurement_type": "Bodyweight",
+                    "value": "81.00",
+                }
+            ),
+            "",
+            json.dumps(
+                {
+                    "date": "2026-01-06",
+                    "measurement_type": "Bodyweight",
+                    "value": "81.20",
+                }
+            ),
+        ]
+    )
+
+    response = api_client.post(
+        "/api/v1/import/measurements/", body, content_type="application/x-ndjson"
+    )
+
+    assert response.status_code == 201
+    assert response.data["imported"] == {"measurements": 2}
+    assert [error["row"] for error in response.data["errors"]] == [2, 3]
+    assert sorted(
+        Measurement.objects.filter(user=user).values_list("value", flat=True)
+    ) == [Decimal("81.20"), Decimal("81.40")]
+
+
+@pytest.mark.django_db
+def test_import_history_command(user, squat, tmp_path, capsys):
+    path = tmp_path / "history.csv"
+    path.write_text(WORKOUT_CSV)
+
+    call_command("import_history", "workouts", str(path), "--user", str(user.id))
+
+    assert WorkoutLog.objects.filter(user=user).count() == 2
+    captured = capsys.readouterr()
+    assert "skipped 4 row(s)" in captured.out
+    assert "Row 3:" in captured.err
@@ -0,0 +1,102 @@
+import pytest
+from datetime import date, timedelta
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.analytics import training_volume
+from api.models import (
+    ExerciseLog,
+    ExerciseSet,
+    ExerciseType,
+    Measurement,
+    MeasurementType,
+    PersonalRecord,
+    WorkoutLog,
+)
+from api.records import rebuild_personal_records
+from api.tests.benchmarks.utils import seed_history
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Reads PostgreSQL query plans."
+)
+
+
+@pytest.fixture
+def seeded(user):
+    other = User.objects.create_user(username="other", password="password")
+    for owner in (user, other):
+        seed_history(owner)
+        rebuild_personal_records(owner.id)
+    measurement_type = MeasurementType.objects.create(name="Bodyweight", unit="kg")
+    Measurement.objects.bulk_create(
+        Measurement(
+            user=owner,
+            measurement_type=measurement_type,
+            value="81.00",
+            date=date.today() - timedelta(days=day),
+        )
+        for owner in (user, other)
+        for day in range(365)
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute("ANALYZE")
+        # Small tables are cheapest to scan whole; make the planner pick an
+        # index wherever a usable one exists, so a missing index shows up.
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+
+def workout_ids(user):
+    return list(WorkoutLog.objects.filter(user=user).values_list("id", flat=True)[:50])
+
+
+HOT_QUERIES = {
+    "workout page": lambda user: WorkoutLog.objects.filter(user=user).order_by(
+        "-begintime", "-id"
+    )[:51],
+    "workout range": lambda user: WorkoutLog.objects.filter(
+        user=user, begintime__gte=date.today() - timedelta(days=30)
+    ),
+    "exercise logs of workouts": lambda user: ExerciseLog.objects.filter(
+        workout_log_id__in=workout_ids(user)
+    ),
+    "sets of exercise logs": lambda user: ExerciseSet.objects.filter(
+        exercise_log__workout_log_id__in=workout_ids(user)
+    ),
+    "exercise logs of a type": lambda user: ExerciseLog.objects.filter(
+        exercise_type=ExerciseType.objects.order_by("id").first(),
+        workout_log__user=user,
+    ),
+    "workouts with an exercise type": lambda user: WorkoutLog.objects.filter(
+        user=user
+    ).with_exercise(exercise_type=ExerciseType.objects.order_by("id").first()),
+    "measurement page": lambda user: Measurement.objects.filter(user=user).order_by(
+        "-date", "-id"
+    )[:51],
+    "measurement series": lambda user: Measurement.objects.filter(
+        user=user,
+        measurement_type=MeasurementType.objects.get(),
+        date__gte=date.today() - timedelta(days=90),
+    ),
+    "personal records": lambda user: PersonalRecord.objects.filter(user=user),
+}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_queries_use_indexes(seeded, user, name):
+    plan = HOT_QUERIES[name](user).explain()
+
+    assert "Seq Scan" not in plan, plan
+
+
+@pytest.mark.django_db
+def test_training_volume_uses_indexes(seeded, user):
+    # training_volume() evaluates its query; EXPLAIN the SQL it ran.
+    with CaptureQueriesContext(connection) as queries:
+        training_volume(user, "week", "exercise_type")
+    with connection.cursor() as cursor:
+        cursor.execute("EXPLAIN " + queries[-1]["sql"])
+        plan = "\n".join(row[0] for row in cursor.fetchall())
+
+    assert "Seq Scan" not in plan, plan
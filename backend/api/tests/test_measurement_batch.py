@@ -0,0 +1,81 @@
+import pytest
+from decimal import Decimal
+from api.models import Measurement
+from api.tests.factories import MeasurementFactory, MeasurementTypeFactory
+
+
+@pytest.fixture
+def check_in(user):
+    measurement_types = MeasurementTypeFactory.create_batch(8)
+    return [
+        {
+            "measurement_type": measurement_type.id,
+            "date": "2026-01-05",
+            "value": "40.50",
+        }
+        for measurement_type in measurement_types
+    ]
+
+
+@pytest.mark.django_db
+def test_batch_creates_measurements_in_constant_queries(
+    api_client, user, check_in, assert_status, django_assert_max_num_queries
+):
+    with django_assert_max_num_queries(2):
+        response = api_client.post(
+            "/api/v1/measurements/batch/", check_in, format="json"
+        )
+
+    assert_status(response, 201)
+    assert len(response.data) == 8
+    assert response.data[0]["measurement_type"]["id"] == check_in[0]["measurement_type"]
+    assert Measurement.objects.filter(user=user).count() == 8
+
+
+@pytest.mark.django_db
+def test_batch_overwrites_measurements_of_the_same_day(
+    api_client, user, check_in, assert_status
+):
+    existing = MeasurementFactory(
+        user=user,
+        measurement_type_id=check_in[0]["measurement_type"],
+        date="2026-01-05",
+        value="39.00",
+    )
+
+    response = api_client.post("/api/v1/measurements/batch/", check_in, format="json")
+
+    assert_status(response, 201)
+    assert Measurement.objects.filter(user=user).count() == 8
+    existing.refresh_from_db()
+    assert existing.value == Decimal("40.50")
+    assert response.data[0]["id"] == existing.id
+
+
+@pytest.mark.django_db
+def test_batch_is_rejected_as_a_whole(api_client, user, check_in, assert_status):
+    unknown = [*check_in, {**check_in[0], "measurement_type": 0}]
+    response = api_client.post("/api/v1/measurements/batch/", unknown, format="json")
+    assert_status(response, 400)
+    assert "measurement_type" in response.data[-1]
+
+    repeated = [*check_in, check_in[0]]
+    response = api_client.post("/api/v1/measurements/batch/", repeated, format="json")
+    assert_status(response, 400)
+
+    assert not Measurement.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_single_create_replaces_measurement_of_the_same_day(
+    api_client, user, check_in, assert_status
+):
+    api_client.post("/api/v1/measurements/", check_in[0], format="json")
+    response = api_client.post(
+        "/api/v1/measurements/", {**check_in[0], "value": "41.00"}, format="json"
+    )
+
+    assert_status(response, 201)
+    assert list(
+        Measurement.objects.filter(user=user).values_list("value", flat=True)
+    ) == [Decimal("41.00")]
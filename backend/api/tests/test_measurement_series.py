@@ -0,0 +1,63 @@
+import pytest
+from datetime import date, timedelta
+from django.db import connection
+from api.tests.factories import MeasurementFactory, MeasurementTypeFactory
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Buckets with PostgreSQL date math."
+)
+
+
+@pytest.mark.django_db
+def test_series_is_bounded_by_requested_points(
+    api_client, user, assert_status, django_assert_max_num_queries
+):
+    bodyweight = MeasurementTypeFactory()
+    start = date.today() - timedelta(days=99)
+    for day in range(100):
+        MeasurementFactory(
+            user=user,
+            measurement_type=bodyweight,
+            date=start + timedelta(days=day),
+            value=80 + day % 4,
+        )
+
+    # measurement type lookup, date bounds, buckets
+    with django_assert_max_num_queries(3):
+        response = api_client.get(
+            "/api/v1/measurements/series/",
+            {"measurement_type": bodyweight.id, "points": 10},
+        )
+
+    assert_status(response, 200)
+    assert len(response.data) == 10
+    first = response.data[0]
+    assert first["date"] == start.isoformat()
+    assert first["count"] == 10
+    assert (first["min"], first["max"], first["average"]) == ("80.00", "83.00", "81.30")
+
+
+@pytest.mark.django_db
+def test_series_within_date_range(api_client, user, assert_status):
+    bodyweight = MeasurementTypeFactory()
+    other_type = MeasurementTypeFactory()
+    today = date.today()
+    for day in range(5):
+        MeasurementFactory(
+            user=user, measurement_type=bodyweight, date=today - timedelta(days=day)
+        )
+        MeasurementFactory(
+            user=user, measurement_type=other_type, date=today - timedelta(days=day)
+        )
+
+    response = api_client.get(
+        "/api/v1/measurements/series/",
+        {
+            "measurement_type": bodyweight.id,
+            "start": (today - timedelta(days=2)).isoformat(),
+            "end": today.isoformat(),
+        },
+    )
+
+    assert_status(response, 200)
+    assert [point["count"] for point in response.data] == [1, 1, 1]
@@ -0,0 +1,53 @@
+import pytest
+from datetime import date, timedelta
+from django.utils import timezone
+from api.pagination import KeysetPagination
+from api.tests.factories import (
+    WorkoutLogFactory,
+    MeasurementFactory,
+    MeasurementTypeFactory,
+)
+
+
+@pytest.mark.django_db
+def test_workout_cursor_pages_cover_history_in_order(api_client, user, assert_status):
+    now = timezone.now()
+    # Two workouts share a begintime so the id tie-breaker is exercised.
+    begintimes = [now - timedelta(days=i) for i in range(5)] + [now]
+    for begintime in begintimes:
+        WorkoutLogFactory(
+            user=user, begintime=begintime, endtime=begintime + timedelta(hours=1)
+        )
+
+    seen = []
+    url = "/api/v1/workouts/?page_size=2"
+    while url:
+        response = api_client.get(url)
+        assert_status(response, 200)
+        assert len(response.data["results"]) <= 2
+        seen.extend(workout["id"] for workout in response.data["results"])
+        url = response.data["next"]
+
+    expected = list(
+        user.workouts.order_by("-begintime", "-id").values_list("id", flat=True)
+    )
+    assert seen == expected
+
+
+@pytest.mark.django_db
+def test_page_size_is_capped(api_client, user, assert_status, monkeypatch):
+    monkeypatch.setattr(KeysetPagination, "max_page_size", 3)
+    measurement_type = MeasurementTypeFactory()
+    for days_ago in range(5):
+        MeasurementFactory(
+            user=user,
+            measurement_type=measurement_type,
+            date=date.today() - timedelta(days=days_ago),
+        )
+
+    response = api_client.get("/api/v1/measurements/?page_size=1000")
+
+    assert_status(response, 200)
+    assert len(response.data["results"]) == 3
+    assert response.data["results"][0]["date"] == date.today().isoformat()
+    assert response.data["next"] is not None
@@ -0,0 +1,151 @@
+import importlib
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+from django.utils import timezone
+from api.models import PersonalRecord
+from api.tests.factories import ExerciseSetFactory
+
+
+def workout_payload(exercise_type, weights):
+    begintime = timezone.now()
+    return {
+        "begintime": begintime.isoformat(),
+        "endtime": (begintime + timezone.timedelta(hours=1)).isoformat(),
+        "exercise_logs": [
+            {
+                "exercise_type": exercise_type.id,
+                "exercise_sets": [
+                    {"reps": 5, "weight_kg": weight, "rir": 2} for weight in weights
+                ],
+            }
+        ],
+    }
+
+
+@pytest.mark.django_db
+def test_personal_records_follow_workout_writes(
+    api_client, user, bench_press, assert_status
+):
+    response = api_client.post(
+        "/api/v1/workouts/", workout_payload(bench_press, [80, 100]), format="json"
+    )
+    assert_status(response, 201)
+    workout = response.data
+
+    response = api_client.get("/api/v1/personal-records/")
+    assert_status(response, 200)
+    assert response.data[0]["exercise_type"]["id"] == bench_press.id
+    assert response.data[0]["weight_kg"] == "100.00"
+
+    # Editing the record set down to 90 kg makes the 90 kg set the record.
+    payload = workout_payload(bench_press, [])
+    payload["exercise_logs"][0]["id"] = workout["exercise_logs"][0]["id"]
+    payload["exercise_logs"][0]["exercise_sets"] = [
+        {**exercise_set, "weight_kg": 90}
+        for exercise_set in workout["exercise_logs"][0]["exercise_sets"]
+    ]
+    payload["exercise_logs"][0]["exercise_sets"][0]["weight_kg"] = 85
+    response = api_client.put(
+        f"/api/v1/workouts/{workout['id']}/", payload, format="json"
+    )
+    assert_status(response, 200)
+    assert PersonalRecord.objects.get(user=user).weight_kg == 90
+
+    # Deleting the workout removes the record set, and with it the record.
+    response = api_client.delete(f"/api/v1/workouts/{workout['id']}/")
+    assert_status(response, 204)
+    assert not PersonalRecord.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_deleting_record_set_promotes_next_best(
+    api_client, user, bench_press, assert_status
+):
+    api_client.post(
+        "/api/v1/workouts/", workout_payload(bench_press, [120]), format="json"
+    )
+    api_client.post(
+        "/api/v1/workouts/", workout_payload(bench_press, [110]), format="json"
+    )
+    record = PersonalRecord.objects.get(user=user)
+    assert record.weight_kg == 120
+
+    workout = record.exercise_set.exercise_log.workout_log
+    response = api_client.delete(f"/api/v1/workouts/{workout.id}/")
+
+    assert_status(response, 204)
+    assert PersonalRecord.objects.get(user=user).weight_kg == 110
+
+
+@pytest.mark.django_db
+def test_replacing_record_set_with_lighter_one_restores_next_best(
+    api_client, user, bench_press, assert_status
+):
+    api_client.post(
+        "/api/v1/workouts/", workout_payload(bench_press, [90]), format="json"
+    )
+    workout = api_client.post(
+        "/api/v1/workouts/", workout_payload(bench_press, [100]), format="json"
+    ).data
+    assert PersonalRecord.objects.get(user=user).weight_kg == 100
+
+    # One PUT deletes the 100 kg record set and adds an 80 kg set.
+    payload = workout_payload(bench_press, [80])
+    payload.update(begintime=workout["begintime"], endtime=workout["endtime"])
+    payload["exercise_logs"][0]["id"] = workout["exercise_logs"][0]["id"]
+    response = api_client.put(
+        f"/api/v1/workouts/{workout['id']}/", payload, format="json"
+    )
+
+    assert_status(response, 200)
+    assert PersonalRecord.objects.get(user=user).weight_kg == 90
+
+
+@pytest.mark.django_db
+def test_personal_records_list_is_one_query(
+    api_client, user, bench_press, squat, django_assert_num_queries
+):
+    for exercise_type in (bench_press, squat):
+        api_client.post(
+            "/api/v1/workouts/", workout_payload(exercise_type, [60]), format="json"
+        )
+
+    with django_assert_num_queries(1):
+        response = api_client.get("/api/v1/personal-records/")
+
+    assert [record["exercise_type"]["name"] for record in response.data] == [
+        "Bench Press",
+        "Squat",
+    ]
+
+
+@pytest.mark.django_db
+def test_rebuild_personal_records_command(user):
+    exercise_set = ExerciseSetFactory(
+        exercise_log__workout_log__user=user, weight_kg="70.00"
+    )
+    ExerciseSetFactory(exercise_log=exercise_set.exercise_log, weight_kg="65.00")
+
+    call_command("rebuild_personal_records", user_ids=[user.id])
+
+    record = PersonalRecord.objects.get(user=user)
+    assert record.exercise_set == exercise_set
+    assert record.exercise_type == exercise_set.exercise_log.exercise_type
+
+
+@pytest.mark.django_db
+def test_migration_backfills_personal_records(user):
+    exercise_set = ExerciseSetFactory(
+        exercise_log__workout_log__user=user, weight_kg="70.00"
+    )
+    ExerciseSetFactory(exercise_log=exercise_set.exercise_log, weight_kg="65.00")
+    other_set = ExerciseSetFactory(weight_kg="40.00")
+    assert not PersonalRecord.objects.exists()
+
+    migration = importlib.import_module("api.migrations.0008_backfill_personal_records")
+    migration.backfill_personal_records(apps, None)
+
+    records = {record.user_id: record for record in PersonalRecord.objects.all()}
+    assert records[user.id].exercise_set == exercise_set
+    assert records[other_set.exercise_log.workout_log.user_id].exercise_set == other_set
@@ -0,0 +1,135 @@
+import pytest
+from django.utils import timezone
+from api.tests.factories import (
+    WorkoutLogFactory,
+    ExerciseLogFactory,
+    ExerciseSetFactory,
+    ExerciseTypeFactory,
+    MeasurementFactory,
+    MeasurementTypeFactory,
+)
+
+
+def seed_workouts(user, workouts, exercises, sets):
+    """
+    Creates `workouts` workouts for the user, each with `exercises` exercise
+    logs of distinct types and `sets` sets per exercise log.
+    """
+    exercise_types = ExerciseTypeFactory.create_batch(exercises)
+    for _ in range(workouts):
+        workout = WorkoutLogFactory(user=user)
+        for exercise_type in exercise_types:
+            exercise_log = ExerciseLogFactory(
+                workout_log=workout, exercise_type=exercise_type
+            )
+            ExerciseSetFactory.create_batch(sets, exercise_log=exercise_log)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("workouts, exercises, sets", [(1, 1, 1), (10, 4, 5)])
+def test_workout_list_query_budget(
+    api_client,
+    user,
+    assert_status,
+    django_assert_max_num_queries,
+    workouts,
+    exercises,
+    sets,
+):
+    seed_workouts(user, workouts, exercises, sets)
+
+    # workouts, exercise logs + exercise types, exercise sets
+    with django_assert_max_num_queries(3):
+        response = api_client.get("/api/v1/workouts/")
+
+    assert_status(response, 200)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("exercises, sets", [(1, 1), (6, 8)])
+def test_workout_retrieve_query_budget(
+    api_client,
+    user,
+    assert_status,
+    django_assert_max_num_queries,
+    exercises,
+    sets,
+):
+    seed_workouts(user, 1, exercises, sets)
+    workout = user.workouts.get()
+
+    with django_assert_max_num_queries(3):
+        response = api_client.get(f"/api/v1/workouts/{workout.id}/")
+
+    assert_status(response, 200)
+    assert len(response.data["exercise_logs"]) == exercises
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("workouts, exercises, sets", [(1, 1, 1), (3, 5, 5)])
+def test_exercise_log_list_query_budget(
+    api_client,
+    user,
+    assert_status,
+    django_assert_max_num_queries,
+    workouts,
+    exercises,
+    sets,
+):
+    seed_workouts(user, workouts, exercises, sets)
+    workout = user.workouts.first()
+
+    # exercise logs + exercise types, exercise sets
+    with django_assert_max_num_queries(2):
+        response = api_client.get(f"/api/v1/workouts/{workout.id}/exercises/")
+
+    assert_status(response, 200)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("count", [1, 25])
+def test_measurement_list_query_budget(
+    api_client, user, assert_status, django_assert_max_num_queries, count
+):
+    for measurement_type in MeasurementTypeFactory.create_batch(count):
+        MeasurementFactory(user=user, measurement_type=measurement_type)
+
+    # measurements + measurement types
+    with django_assert_max_num_queries(1):
+        response = api_client.get("/api/v1/measurements/")
+
+    assert_status(response, 200)
+    assert len(response.data["results"]) == count
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("exercises, sets", [(1, 1), (10, 4)])
+def test_workout_create_query_budget(
+    api_client, assert_status, django_assert_max_num_queries, exercises, sets
+):
+    exercise_types = ExerciseTypeFactory.create_batch(exercises)
+    begintime = timezone.now()
+    payload = {
+        "begintime": begintime.isoformat(),
+        "endtime": (begintime + timezone.timedelta(hours=1)).isoformat(),
+        "exercise_logs": [
+            {
+                "exercise_type": exercise_type.id,
+                "exercise_sets": [
+                    {"reps": 5, "weight_kg": 100.0, "rir": 2} for _ in range(sets)
+                ],
+            }
+            for exercise_type in exercise_types
+        ],
+    }
+
+    # exercise types, savepoint, workout, exercise logs, sets, personal
+    # record lookup and upsert, release, and two prefetches for the response
+    with django_assert_max_num_queries(10):
+        response = api_client.post("/api/v1/workouts/", payload, format="json")
+
+    assert_status(response, 201)
+    assert len(response.data["exercise_logs"]) == exercises
+    assert all(
+        len(log["exercise_sets"]) == sets for log in response.data["exercise_logs"]
+    )
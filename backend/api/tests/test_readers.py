@@ -0,0 +1,100 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from django.core.cache import cache
+from api import views
+from api.tests.factories import (
+    ExerciseLogFactory,
+    ExerciseSetFactory,
+    ExerciseTypeFactory,
+    MeasurementFactory,
+    MeasurementTypeFactory,
+    WorkoutLogFactory,
+)
+
+
+@pytest.fixture
+def history(user):
+    exercise_types = ExerciseTypeFactory.create_batch(3)
+    begintime = datetime(2026, 1, 5, 7, 30, 15, 123456, tzinfo=timezone.utc)
+    for day in range(4):
+        workout = WorkoutLogFactory(
+            user=user,
+            begintime=begintime + timedelta(days=day),
+            endtime=begintime + timedelta(days=day, hours=1, seconds=7),
+        )
+        # Types repeat across workouts, so the shared lookup is exercised.
+        for exercise_type in exercise_types[: day % 3 + 1]:
+            exercise_log = ExerciseLogFactory(
+                workout_log=workout, exercise_type=exercise_type
+            )
+            for weight_kg in ("0.00", "62.50", "300.00"):
+                ExerciseSetFactory(
+                    exercise_log=exercise_log, weight_kg=weight_kg, reps=day, rir=1
+                )
+    # A workout without exercises.
+    WorkoutLogFactory(user=user)
+
+    for measurement_type in MeasurementTypeFactory.create_batch(2):
+        # Both types share each date, so the id tie-breaker is exercised.
+        for day, value in enumerate(("0.50", "81.00", "9999.99")):
+            MeasurementFactory(
+                user=user,
+                measurement_type=measurement_type,
+                value=value,
+                date=date(2026, 2, 1) + timedelta(days=day),
+            )
+
+
+def fetch_both(api_client, monkeypatch, viewset, url):
+    fast = api_client.get(url)
+    # Nothing is written in between, so drop the cached response by hand.
+    cache.clear()
+    monkeypatch.setattr(viewset, "fast_reader", None)
+    slow = api_client.get(url)
+    return fast, slow
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "viewset, url",
+    [
+        (views.WorkoutLogViewSet, "/api/v1/workouts/?page_size=200"),
+        (views.MeasurementViewSet, "/api/v1/measurements/?page_size=200"),
+    ],
+)
+def test_fast_list_is_byte_identical(
+    api_client, history, assert_status, monkeypatch, viewset, url
+):
+    fast, slow = fetch_both(api_client, monkeypatch, viewset, url)
+
+    assert_status(fast, 200)
+    assert_status(slow, 200)
+    assert fast.content == slow.content
+
+
+@pytest.mark.django_db
+def test_fast_retrieve_and_nested_list_are_byte_identical(
+    api_client, user, history, monkeypatch
+):
+    workout = user.workouts.order_by("begintime").last()
+
+    fast, slow = fetch_both(
+        api_client,
+        monkeypatch,
+        views.WorkoutLogViewSet,
+        f"/api/v1/workouts/{workout.id}/",
+    )
+    assert fast.content == slow.content
+
+    fast, slow = fetch_both(
+        api_client,
+        monkeypatch,
+        views.ExerciseLogViewSet,
+        f"/api/v1/workouts/{workout.id}/exercises/",
+    )
+    assert fast.content == slow.content
+
+
+@pytest.mark.django_db
+def test_fast_retrieve_of_unknown_workout_is_404(api_client, assert_status):
+    assert_status(api_client.get("/api/v1/workouts/999/"), 404)
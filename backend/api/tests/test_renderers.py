@@ -0,0 +1,69 @@
+import io
+import pytest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from api import parsers, renderers
+from api.parsers import ORJSONParser
+from api.renderers import ORJSONRenderer
+
+PAYLOAD = {
+    "id": 1,
+    "name": "Bench press   über",
+    "weight_kg": Decimal("82.50"),
+    "begintime": datetime(2026, 3, 1, 9, 30, 15, 123456, tzinfo=timezone.utc),
+    "date": date(2026, 3, 1),
+    "values": [1.5, None, True],
+    7: "int key",
+}
+
+
+def test_renderer_matches_drf_output():
+    assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+
+def test_renderer_falls_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(renderers, "orjson", None)
+
+    assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+
+
+def test_parser_matches_drf_and_rejects_invalid_json(monkeypatch):
+    body = b'{"reps": 8, "weight_kg": "82.50", "rir": null}'
+
+    assert ORJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(
+        io.BytesIO(body)
+    )
+    with pytest.raises(ParseError):
+        ORJSONParser().parse(io.BytesIO(b'{"reps": NaN}'))
+
+    monkeypatch.setattr(parsers, "orjson", None)
+    assert ORJSONParser().parse(io.BytesIO(body)) == {
+        "reps": 8,
+        "weight_kg": "82.50",
+        "rir": None,
+    }
+
+
+@pytest.mark.django_db
+def test_api_renders_and_parses_with_orjson(api_client, bench_press, assert_status):
+    response = api_client.post(
+        "/api/v1/workouts/",
+        {
+            "begintime": "2026-03-01T09:00:00Z",
+            "endtime": "2026-03-01T10:00:00Z",
+            "exercise_logs": [
+                {
+                    "exercise_type": bench_press.id,
+                    "exercise_sets": [{"reps": 8, "weight_kg": "82.50", "rir": 2}],
+                }
+            ],
+        },
+        format="json",
+    )
+
+    assert_status(response, 201)
+    assert isinstance(response.accepted_renderer, ORJSONRenderer)
+    assert response.content == JSONRenderer().render(response.data)
@@ -0,0 +1,58 @@
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+from api.cache import response_cache_stats
+from api.tests.factories import MeasurementTypeFactory
+
+
+@pytest.mark.django_db
+def test_repeated_reads_are_served_from_cache(
+    api_client, assert_status, django_assert_num_queries
+):
+    first = api_client.get("/api/v1/workouts/?page_size=10")
+    assert_status(first, 200)
+
+    with django_assert_num_queries(0):
+        second = api_client.get("/api/v1/workouts/?page_size=10")
+
+    assert_status(second, 200)
+    assert second.content == first.content
+    assert response_cache_stats() == {"hits": 1, "misses": 1}
+
+    # Other query parameters get their own entry.
+    api_client.get("/api/v1/workouts/?page_size=5")
+    assert response_cache_stats() == {"hits": 1, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_writes_invalidate_cached_responses(api_client, assert_status):
+    assert api_client.get("/api/v1/measurements/").data["results"] == []
+
+    response = api_client.post(
+        "/api/v1/measurements/",
+        {
+            "measurement_type": MeasurementTypeFactory().id,
+            "value": "80.50",
+            "date": "2026-01-01",
+        },
+        format="json",
+    )
+    assert_status(response, 201)
+
+    response = api_client.get("/api/v1/measurements/")
+    assert_status(response, 200)
+    assert len(response.json()["results"]) == 1
+
+
+@pytest.mark.django_db
+def test_cache_stats_are_admin_only(api_client, assert_status):
+    assert_status(api_client.get("/api/v1/stats/response-cache/"), 403)
+
+    admin_client = APIClient()
+    admin_client.force_authenticate(
+        User.objects.create_user(username="admin", is_staff=True)
+    )
+    response = admin_client.get("/api/v1/stats/response-cache/")
+
+    assert_status(response, 200)
+    assert set(response.data) == {"hits", "misses"}
@@ -0,0 +1,119 @@
+import logging
+import pytest
+import re
+import time
+from datetime import timedelta
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+from api import serializers
+from api.middleware import logger
+from api.tests.factories import MeasurementFactory, WorkoutLogFactory
+
+
+def parse_server_timing(header):
+    metrics = {}
+    for metric in header.split(", "):
+        name, *params = metric.split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+@pytest.fixture
+def server_timing_header(settings):
+    settings.SERVER_TIMING_HEADER = True
+
+
+@pytest.fixture
+def timing_logs(caplog, monkeypatch):
+    # The timing logger writes to its own handler only.
+    monkeypatch.setattr(logger, "propagate", True)
+    caplog.set_level(logging.INFO, logger="api.timing")
+    return caplog
+
+
+@pytest.mark.django_db
+def test_server_timing_breaks_down_drf_responses(
+    api_client, user, timing_logs, server_timing_header
+):
+    WorkoutLogFactory.create_batch(3, user=user)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get("/api/v1/workouts/")
+
+    metrics = parse_server_timing(response["Server-Timing"])
+    assert set(metrics) == {"db", "serialize", "render", "app", "total"}
+    assert metrics["db"]["desc"] == f'"{len(queries)} queries"'
+    parts = sum(float(metrics[name]["dur"]) for name in ("db", "serialize", "render"))
+    assert parts <= float(metrics["total"]["dur"]) + 0.5
+
+    (record,) = timing_logs.records
+    assert record.levelno == logging.INFO
+    assert record.timing["path"] == "/api/v1/workouts/"
+    assert record.timing["queries"] == len(queries)
+    assert re.search(r"status=200 queries=\d+ total_ms=", record.getMessage())
+
+
+@pytest.mark.django_db
+def test_server_timing_counts_queries_of_async_views(user, server_timing_header):
+    MeasurementFactory(user=user)
+    headers = {"Authorization": f"Bearer {AccessToken.for_user(user)}"}
+
+    # Through the ASGI handler, where the ORM runs in another thread.
+    with CaptureQueriesContext(connection) as queries:
+        response = async_to_sync(AsyncClient().get)(
+            "/api/v1/async/measurements/", headers=headers
+        )
+
+    metrics = parse_server_timing(response["Server-Timing"])
+    assert metrics["db"]["desc"] == f'"{len(queries)} queries"'
+    assert float(metrics["render"]["dur"]) >= 0
+
+
+@pytest.mark.django_db
+def test_serializing_writes_is_timed(
+    api_client, bench_press, monkeypatch, server_timing_header
+):
+    to_representation = serializers.WorkoutLogWriteSerializer.to_representation
+
+    def slow_to_representation(self, instance):
+        time.sleep(0.01)
+        return to_representation(self, instance)
+
+    monkeypatch.setattr(
+        serializers.WorkoutLogWriteSerializer,
+        "to_representation",
+        slow_to_representation,
+    )
+    begintime = timezone.now()
+    response = api_client.post(
+        "/api/v1/workouts/",
+        {
+            "begintime": begintime.isoformat(),
+            "endtime": (begintime + timedelta(hours=1)).isoformat(),
+            "exercise_logs": [],
+        },
+        format="json",
+    )
+
+    assert response.status_code == 201
+    metrics = parse_server_timing(response["Server-Timing"])
+    assert float(metrics["serialize"]["dur"]) >= 10
+
+
+@pytest.mark.django_db
+def test_slow_requests_are_logged_with_their_sql(
+    api_client, user, timing_logs, settings
+):
+    settings.SLOW_REQUEST_THRESHOLD_MS = 0
+
+    response = api_client.get("/api/v1/measurements/")
+
+    assert "Server-Timing" not in response
+    (record,) = timing_logs.records
+    assert record.levelno == logging.WARNING
+    assert any('"api_measurement"' in query["sql"] for query in record.queries)
+    assert '"api_measurement"' in record.getMessage()
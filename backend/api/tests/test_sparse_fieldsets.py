@@ -0,0 +1,92 @@
+import pytest
+from django.core.cache import cache
+from api import views
+from api.tests.factories import (
+    ExerciseLogFactory,
+    ExerciseSetFactory,
+    MeasurementFactory,
+    WorkoutLogFactory,
+)
+
+
+@pytest.fixture
+def workout(user, bench_press, squat):
+    workout = WorkoutLogFactory(user=user)
+    for exercise_type in (bench_press, squat):
+        ExerciseSetFactory.create_batch(
+            2,
+            exercise_log=ExerciseLogFactory(
+                workout_log=workout, exercise_type=exercise_type
+            ),
+        )
+    MeasurementFactory.create_batch(2, user=user)
+    return workout
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "viewset, url, queries",
+    [
+        # Workouts, then their logs joined with their types; no sets.
+        (
+            views.WorkoutLogViewSet,
+            "/api/v1/workouts/?fields=begintime,exercise_logs.exercise_type.name",
+            2,
+        ),
+        # Only the workouts.
+        (views.WorkoutLogViewSet, "/api/v1/workouts/?fields=id,endtime", 1),
+        # Logs with type ids and full sets.
+        (
+            views.WorkoutLogViewSet,
+            "/api/v1/workouts/?expand=exercise_logs.exercise_sets",
+            3,
+        ),
+        (
+            views.ExerciseLogViewSet,
+            "/api/v1/workouts/{workout}/exercises/?fields=id,exercise_type",
+            1,
+        ),
+        (views.MeasurementViewSet, "/api/v1/measurements/?fields=date,value", 1),
+        (
+            views.MeasurementViewSet,
+            "/api/v1/measurements/?expand=measurement_type&fields=measurement_type.unit",
+            1,
+        ),
+    ],
+)
+def test_fast_and_serializer_paths_render_the_same_sparse_shape(
+    api_client, workout, monkeypatch, django_assert_num_queries, viewset, url, queries
+):
+    url = url.format(workout=workout.id)
+    with django_assert_num_queries(queries):
+        fast = api_client.get(url)
+
+    cache.clear()
+    monkeypatch.setattr(viewset, "fast_reader", None)
+    with django_assert_num_queries(queries):
+        slow = api_client.get(url)
+
+    assert fast.status_code == 200
+    assert fast.content == slow.content
+
+
+@pytest.mark.django_db
+def test_sparse_workout_shape(api_client, workout, bench_press):
+    response = api_client.get(
+        "/api/v1/workouts/?fields=begintime,exercise_logs.exercise_type.name"
+    )
+    assert response.data["results"] == [
+        {
+            "begintime": response.data["results"][0]["begintime"],
+            "exercise_logs": [
+                {"exercise_type": {"name": "Bench Press"}},
+                {"exercise_type": {"name": "Squat"}},
+            ],
+        }
+    ]
+
+    response = api_client.get(f"/api/v1/workouts/{workout.id}/?expand=exercise_logs")
+    assert response.data["exercise_logs"][0] == {
+        "id": response.data["exercise_logs"][0]["id"],
+        "exercise_type": bench_press.id,
+    }
@@ -0,0 +1,72 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from api.tests.factories import ExerciseLogFactory, WorkoutLogFactory
+
+
+@pytest.fixture
+def workouts(user, bench_press, squat):
+    # One workout a week from January to March; squats every other week and
+    # bench press twice in the workouts that have it.
+    created = []
+    for week in range(12):
+        begintime = datetime(2026, 1, 5, 18, tzinfo=timezone.utc) + timedelta(
+            weeks=week
+        )
+        workout = WorkoutLogFactory(
+            user=user, begintime=begintime, endtime=begintime + timedelta(hours=1)
+        )
+        if week % 2 == 0:
+            ExerciseLogFactory(workout_log=workout, exercise_type=squat)
+        else:
+            ExerciseLogFactory.create_batch(
+                2, workout_log=workout, exercise_type=bench_press
+            )
+        created.append(workout)
+    return created
+
+
+def list_ids(api_client, assert_status, **params):
+    response = api_client.get("/api/v1/workouts/", {**params, "page_size": 200})
+    assert_status(response, 200)
+    return [workout["id"] for workout in response.data["results"]]
+
+
+@pytest.mark.django_db
+def test_filter_by_begintime_range(api_client, workouts, assert_status):
+    ids = list_ids(api_client, assert_status, start="2026-02-01", end="2026-02-28")
+
+    assert ids == [
+        workout.id for workout in reversed(workouts) if workout.begintime.month == 2
+    ]
+
+
+@pytest.mark.django_db
+def test_exercise_filters_return_each_workout_once(
+    api_client, workouts, bench_press, assert_status
+):
+    bench_ids = list_ids(api_client, assert_status, exercise_type=bench_press.id)
+    assert bench_ids == [workout.id for workout in reversed(workouts[1::2])]
+
+    quad_ids = list_ids(
+        api_client,
+        assert_status,
+        muscle_group="QUAD",
+        start="2026-01-01",
+        end="2026-01-31",
+    )
+    assert quad_ids == [
+        workout.id
+        for workout in reversed(workouts[::2])
+        if workout.begintime.month == 1
+    ]
+
+
+@pytest.mark.django_db
+def test_invalid_filters_are_rejected(api_client, workouts, assert_status):
+    response = api_client.get(
+        "/api/v1/workouts/",
+        {"start": "2026-03-01", "end": "2026-02-01", "muscle_group": "NECK"},
+    )
+
+    assert_status(response, 400)
+    assert "muscle_group" in response.data
@@ -0,0 +1,79 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from api.tests.factories import (
+    ExerciseLogFactory,
+    ExerciseSetFactory,
+    WorkoutLogFactory,
+)
+
+
+@pytest.fixture
+def workouts(user, bench_press, squat):
+    begintime = datetime(2026, 3, 2, 18, tzinfo=timezone.utc)
+    full = WorkoutLogFactory(
+        user=user,
+        begintime=begintime,
+        endtime=begintime + timedelta(hours=1, minutes=15),
+    )
+    for exercise_type, weights in ((bench_press, ("60.00", "80.00")), (squat, ())):
+        exercise_log = ExerciseLogFactory(workout_log=full, exercise_type=exercise_type)
+        for weight_kg in weights:
+            ExerciseSetFactory(exercise_log=exercise_log, weight_kg=weight_kg, reps=5)
+    empty = WorkoutLogFactory(
+        user=user,
+        begintime=begintime + timedelta(days=1),
+        endtime=begintime + timedelta(days=1, minutes=30),
+    )
+    return full, empty
+
+
+@pytest.mark.django_db
+def test_summary_annotates_each_workout(api_client, workouts, assert_status):
+    full, empty = workouts
+
+    response = api_client.get("/api/v1/workouts/summary/")
+
+    assert_status(response, 200)
+    assert response.json()["results"] == [
+        {
+            "id": empty.id,
+            "begintime": "2026-03-03T18:00:00Z",
+            "endtime": "2026-03-03T18:30:00Z",
+            "duration": "00:30:00",
+            "exercise_count": 0,
+            "set_count": 0,
+            "total_volume": "0.00",
+        },
+        {
+            "id": full.id,
+            "begintime": "2026-03-02T18:00:00Z",
+            "endtime": "2026-03-02T19:15:00Z",
+            "duration": "01:15:00",
+            "exercise_count": 2,
+            "set_count": 2,
+            "total_volume": "700.00",
+        },
+    ]
+
+
+@pytest.mark.django_db
+def test_summary_is_one_query_and_takes_list_filters(
+    api_client, workouts, bench_press, assert_status
+):
+    full, _ = workouts
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.get(
+            "/api/v1/workouts/summary/",
+            {"exercise_type": bench_press.id, "page_size": 1},
+        )
+
+    assert_status(response, 200)
+    assert [workout["id"] for workout in response.data["results"]] == [full.id]
+    assert response.data["next"] is None
+    summary_queries = [
+        query["sql"] for query in queries if "api_workoutlog" in query["sql"]
+    ]
+    assert len(summary_queries) == 1
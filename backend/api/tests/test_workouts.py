@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from api.models import WorkoutLog, ExerciseLog, ExerciseSet
 from datetime import datetime, timedelta, timezone
@@ -126,3 +128,86 @@ def test_workout_validation_end_before_start(api_client, user, assert_status):
 
     assert_status(response, 400)
     assert "non_field_errors" in response.data or "endtime" in response.data
+
+
+@pytest.mark.django_db
+def test_nested_workout_update_only_writes_changes(
+    api_client, user, bench_press, assert_status
+):
+    """
+    A PUT of the unchanged tree must not write anything, and editing one set
+    must issue exactly one UPDATE regardless of the size of the workout.
+    """
+    workout = WorkoutLog.objects.create(
+        user=user,
+        begintime=datetime.now(tz=timezone.utc),
+        endtime=datetime.now(tz=timezone.utc) + timedelta(hours=1),
+    )
+    bench_log = ExerciseLog.objects.create(
+        workout_log=workout, exercise_type=bench_press
+    )
+    sets = [
+        ExerciseSet.objects.create(
+            exercise_log=bench_log, reps=10, weight_kg=100, rir=2
+        )
+        for _ in range(10)
+    ]
+
+    url = reverse("workouts-detail", args=[workout.id])
+    payload = {
+        "begintime": workout.begintime.isoformat(),
+        "endtime": workout.endtime.isoformat(),
+        "exercise_logs": [
+            {
+                "id": bench_log.id,
+                "exercise_type": bench_press.id,
+                "exercise_sets": [
+                    {"id": s.id, "reps": 10, "weight_kg": 100.0, "rir": 2} for s in sets
+                ],
+            }
+        ],
+    }
+
+    def writes(queries):
+        return [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+            and "api_personalrecord" not in query["sql"]
+        ]
+
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.put(url, payload, format="json")
+    assert_status(response, 200)
+    assert writes(queries) == []
+
+    payload["exercise_logs"][0]["exercise_sets"][3]["weight_kg"] = 110.0
+    with CaptureQueriesContext(connection) as queries:
+        response = api_client.put(url, payload, format="json")
+    assert_status(response, 200)
+    assert len(writes(queries)) == 1
+
+    sets[3].refresh_from_db()
+    assert sets[3].weight_kg == 110
+
+
+@pytest.mark.django_db
+def test_exercise_sets_expose_stored_e1rm_and_volume(
+    api_client, user, bench_press, assert_status
+):
+    workout = WorkoutLog.objects.create(
+        user=user,
+        begintime=datetime.now(tz=timezone.utc),
+        endtime=datetime.now(tz=timezone.utc) + timedelta(hours=1),
+    )
+    bench_log = ExerciseLog.objects.create(
+        workout_log=workout, exercise_type=bench_press
+    )
+    ExerciseSet.objects.create(exercise_log=bench_log, reps=8, weight_kg=90, rir=2)
+
+    response = api_client.get(reverse("workouts-detail", args=[workout.id]))
+
+    assert_status(response, 200)
+    exercise_set = response.data["exercise_logs"][0]["exercise_sets"][0]
+    assert exercise_set["e1rm"] == "120.00"  # 90 * (30 + 8 + 2) / 30
+    assert exercise_set["volume"] == "720.00"
@@ -0,0 +1,72 @@
+"""
+Timings of the request being served, collected for `ServerTimingMiddleware`.
+Code that serializes or renders marks the work with `timed`. Database time is
+collected by `record_query`, an execute wrapper on every connection, and left
+out of the phases it happens in, so the figures add up instead of
+overlapping.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+current_timings = ContextVar("current_timings", default=None)
+
+
+class RequestTimings:
+    def __init__(self):
+        self.started = perf_counter()
+        self.durations = defaultdict(float)
+        # (sql, seconds) of every query run.
+        self.queries = []
+
+    def add(self, name, seconds):
+        self.durations[name] += seconds
+
+    def elapsed(self):
+        return perf_counter() - self.started
+
+
+def record_query(execute, sql, params, many, context):
+    timings = current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    start = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        seconds = perf_counter() - start
+        timings.durations["db"] += seconds
+        timings.queries.append((sql, seconds))
+
+
+def install_execute_wrapper(connection):
+    """
+    Adds `record_query` to a connection's execute wrappers for good, as
+    `connection.execute_wrapper` does for the span of a block. Connections
+    are per thread and the async views query from a thread other than the
+    request's, so the wrapper is installed as connections open and reads the
+    timings from the request's context.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+@contextmanager
+def timed(name):
+    """
+    Adds the time spent in the block, less its database time, to phase
+    `name` of the current request. Does nothing outside a request.
+    """
+    timings = current_timings.get()
+    if timings is None:
+        yield
+        return
+    start = perf_counter()
+    db_before = timings.durations["db"]
+    try:
+        yield
+    finally:
+        db = timings.durations["db"] - db_before
+        timings.add(name, perf_counter() - start - db)
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import views, async_views
 
 router = DefaultRouter()
 router.register(
@@ -11,8 +11,26 @@ router.register(
 )
 router.register("measurements", views.MeasurementViewSet, basename="measurements")
 router.register("workouts", views.WorkoutLogViewSet, basename="workouts")
+router.register(
+    "personal-records", views.PersonalRecordViewSet, basename="personal-records"
+)
+router.register(
+    "analytics/volume", views.TrainingVolumeViewSet, basename="training-volume"
+)
+router.register("export", views.ExportViewSet, basename="export")
+router.register("import", views.ImportViewSet, basename="import")
 router.register("exercise-types", views.ExerciseTypeViewSet, basename="exercise-types")
 router.register("auth/users", views.UserViewSet, basename="me")
+router.register(
+    "stats/response-cache",
+    views.ResponseCacheStatsViewSet,
+    basename="response-cache-stats",
+)
+router.register(
+    "stats/connection-pool",
+    views.ConnectionPoolStatsViewSet,
+    basename="connection-pool-stats",
+)
 
 urlpatterns = [
     path("", include(router.urls)),
@@ -24,4 +42,8 @@ urlpatterns = [
         "exercises/<int:exercise_pk>/sets/",
         views.ExerciseSetViewSet.as_view({"get": "list", "post": "create"}),
     ),
+    path("async/workouts/", async_views.WorkoutListView.as_view()),
+    path("async/measurements/", async_views.MeasurementListView.as_view()),
+    path("async/exercise-types/", async_views.ExerciseTypeListView.as_view()),
+    path("async/measurement-types/", async_views.MeasurementTypeListView.as_view()),
 ]
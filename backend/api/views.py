@@ -1,7 +1,10 @@
+from datetime import timedelta
 from django.contrib.auth.models import User
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, mixins, status
-from rest_framework.exceptions import MethodNotAllowed
+from rest_framework.exceptions import MethodNotAllowed, ParseError
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from .serializers import (
@@ -13,11 +16,39 @@ from .serializers import (
     MeasurementWriteSerializer,
     WorkoutLogReadSerializer,
     WorkoutLogWriteSerializer,
+    WorkoutLogFilterSerializer,
+    WorkoutSummarySerializer,
     ExerciseLogReadSerializer,
     ExerciseLogWriteSerializer,
     ExerciseSetSerializer,
     ExerciseTypeSerializer,
+    ExerciseTypeSearchQuerySerializer,
+    PersonalRecordSerializer,
+    TrainingVolumeQuerySerializer,
+    TrainingVolumeSerializer,
+    MeasurementSeriesQuerySerializer,
+    MeasurementSeriesPointSerializer,
 )
+from .analytics import training_volume, measurement_series, day_start
+from .search import search_exercise_types
+from .records import record_exercise_sets, restore_personal_records
+from .pagination import WorkoutLogPagination, MeasurementPagination
+from .mixins import (
+    ServerTimingMixin,
+    DataVersionMixin,
+    ResponseCacheMixin,
+    FastReadMixin,
+    CatalogCacheMixin,
+    SparseFieldsetMixin,
+)
+from .fieldsets import expands
+from .readers import WorkoutLogReader, ExerciseLogReader, MeasurementReader
+from .renderers import NDJSONRenderer, CSVRenderer
+from .parsers import ORJSONParser, CSVParser, NDJSONParser
+from .exports import aiterate, workout_export, measurement_export
+from .imports import import_workouts, import_measurements
+from .cache import response_cache_stats
+from .database import connection_pool_stats
 from .models import (
     MeasurementType,
     Measurement,
@@ -26,6 +57,8 @@ from .models import (
     ExerciseLog,
     ExerciseSet,
     ExerciseType,
+    PersonalRecord,
+    exercise_sets_prefetch,
 )
 from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 
@@ -33,7 +66,7 @@ from rest_framework.permissions import IsAuthenticated, IsAdminUser, AllowAny
 # USER
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(ServerTimingMixin, viewsets.ModelViewSet):
     def get_queryset(self):
         if self.request.user.is_authenticated:
             return User.objects.filter(id=self.request.user.id)
@@ -64,7 +97,7 @@ class UserViewSet(viewsets.ModelViewSet):
     def me(self, request):
         user = request.user
         if request.method == "GET":
-            serializer = UserReadSerializer(user)
+            serializer = self.get_serializer(user, serializer_class=UserReadSerializer)
             return Response(serializer.data)
 
         elif request.method == "DELETE":
@@ -72,15 +105,18 @@ class UserViewSet(viewsets.ModelViewSet):
             return Response(status=status.HTTP_204_NO_CONTENT)
 
         elif request.method in ["PUT", "PATCH"]:
-            serializer = UserRegisterSerializer(
-                user, data=request.data, partial=(request.method == "PATCH")
+            serializer = self.get_serializer(
+                user,
+                data=request.data,
+                partial=(request.method == "PATCH"),
+                serializer_class=UserRegisterSerializer,
             )
             serializer.is_valid(raise_exception=True)
             serializer.save()
             return Response(serializer.data)
 
 
-class UserProfileViewSet(viewsets.ModelViewSet):
+class UserProfileViewSet(ServerTimingMixin, viewsets.ModelViewSet):
     serializer_class = UserProfileSerializer
 
     def get_queryset(self):
@@ -99,40 +135,141 @@ class UserProfileViewSet(viewsets.ModelViewSet):
         serializer.save(user=self.request.user)
 
 
+class ResponseCacheStatsViewSet(ServerTimingMixin, viewsets.ViewSet):
+    permission_classes = [IsAdminUser]
+
+    def list(self, request):
+        return Response(response_cache_stats())
+
+
+class ConnectionPoolStatsViewSet(ServerTimingMixin, viewsets.ViewSet):
+    """
+    Connection pool statistics of the process that answers; each worker
+    process has a pool of its own.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def list(self, request):
+        stats = connection_pool_stats()
+        return Response({"pooled": stats is not None, **(stats or {})})
+
+
 # MEASUREMENT
 
 
-class MeasurementTypeViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+class MeasurementTypeViewSet(
+    ServerTimingMixin, CatalogCacheMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
+    catalog_name = "measurement-types"
     queryset = MeasurementType.objects.order_by("id")
     serializer_class = MeasurementTypeSerializer
     permission_classes = [AllowAny]
 
 
-class MeasurementViewSet(viewsets.ModelViewSet):
+class MeasurementViewSet(
+    ServerTimingMixin,
+    SparseFieldsetMixin,
+    FastReadMixin,
+    ResponseCacheMixin,
+    viewsets.ModelViewSet,
+):
     permission_classes = [IsAuthenticated]
+    pagination_class = MeasurementPagination
+    fast_reader = MeasurementReader
+    batch_max_size = 500
 
     def get_queryset(self):
-        return Measurement.objects.filter(user=self.request.user).select_related(
-            "measurement_type"
-        )
+        measurements = Measurement.objects.filter(user=self.request.user)
+        if expands(self.get_fieldset(), "measurement_type"):
+            measurements = measurements.select_related("measurement_type")
+        return measurements
 
     def get_serializer_class(self):
-        if self.action in ["create", "update", "partial_update"]:
+        if self.action in ["create", "update", "partial_update", "batch"]:
             return MeasurementWriteSerializer
         return MeasurementReadSerializer
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=["post"], url_path="batch")
+    def batch(self, request):
+        serializer = self.get_serializer(
+            data=request.data, many=True, max_length=self.batch_max_size
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save(user=request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    @action(detail=False, methods=["get"], url_path="series")
+    def series(self, request):
+        query = MeasurementSeriesQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        points = measurement_series(request.user, **query.validated_data)
+        serializer = self.get_serializer(
+            points, many=True, serializer_class=MeasurementSeriesPointSerializer
+        )
+        return Response(serializer.data)
+
 
 # WORKOUT
 
 
-class WorkoutLogViewSet(viewsets.ModelViewSet):
+def filter_workouts(queryset, query_params):
+    """
+    Narrows workouts to those begun between the `start` and `end` dates
+    (inclusive) that include an exercise of `exercise_type` or `muscle_group`.
+    """
+    query = WorkoutLogFilterSerializer(data=query_params)
+    query.is_valid(raise_exception=True)
+    filters = query.validated_data
+
+    # Compare against day boundaries so the begintime index stays usable.
+    if "start" in filters:
+        queryset = queryset.filter(begintime__gte=day_start(filters["start"]))
+    if "end" in filters:
+        queryset = queryset.filter(
+            begintime__lt=day_start(filters["end"] + timedelta(days=1))
+        )
+    if "exercise_type" in filters:
+        queryset = queryset.with_exercise(exercise_type_id=filters["exercise_type"])
+    if "muscle_group" in filters:
+        queryset = queryset.with_exercise(
+            exercise_type__muscle_group=filters["muscle_group"]
+        )
+    return queryset
+
+
+class WorkoutLogViewSet(
+    ServerTimingMixin,
+    SparseFieldsetMixin,
+    FastReadMixin,
+    ResponseCacheMixin,
+    viewsets.ModelViewSet,
+):
     permission_classes = [IsAuthenticated]
+    pagination_class = WorkoutLogPagination
+    fast_reader = WorkoutLogReader
 
     def get_queryset(self):
-        return WorkoutLog.objects.filter(user=self.request.user)
+        workouts = WorkoutLog.objects.filter(user=self.request.user)
+        fieldset = self.get_fieldset()
+        if not expands(fieldset, "exercise_logs", many=True):
+            return workouts
+        return workouts.with_exercise_tree(
+            exercise_type=expands(fieldset, "exercise_logs", "exercise_type"),
+            exercise_sets=expands(
+                fieldset, "exercise_logs", "exercise_sets", many=True
+            ),
+        )
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        if self.action not in ("list", "summary"):
+            return queryset
+        return filter_workouts(queryset, self.request.query_params)
 
     def get_serializer_class(self):
         if self.action in ["create", "update", "partial_update"]:
@@ -142,21 +279,162 @@ class WorkoutLogViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
 
+    @action(detail=False, methods=["get"])
+    def summary(self, request):
+        """
+        Lists workouts with their duration, exercise and set counts and total
+        volume instead of the full exercise tree; takes the list's filters.
+        """
+        workouts = self.filter_queryset(WorkoutLog.objects.filter(user=request.user))
+        page = self.paginate_queryset(workouts.summaries())
+        serializer = self.get_serializer(
+            page, many=True, serializer_class=WorkoutSummarySerializer
+        )
+        return self.get_paginated_response(serializer.data)
+
+    def perform_destroy(self, instance):
+        exercise_type_ids = {
+            exercise_log.exercise_type_id
+            for exercise_log in instance.exercise_logs.all()
+        }
+        instance.delete()
+        restore_personal_records(self.request.user.id, exercise_type_ids)
+
+
+class PersonalRecordViewSet(
+    ServerTimingMixin, DataVersionMixin, mixins.ListModelMixin, viewsets.GenericViewSet
+):
+    permission_classes = [IsAuthenticated]
+    serializer_class = PersonalRecordSerializer
+
+    def get_queryset(self):
+        return (
+            PersonalRecord.objects.filter(user=self.request.user)
+            .select_related("exercise_type")
+            .order_by("exercise_type__name")
+        )
+
+
+class TrainingVolumeViewSet(ServerTimingMixin, DataVersionMixin, viewsets.ViewSet):
+    permission_classes = [IsAuthenticated]
+
+    def list(self, request):
+        query = TrainingVolumeQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        rows = training_volume(request.user, **query.validated_data)
+        serializer = self.get_serializer(
+            rows, many=True, serializer_class=TrainingVolumeSerializer
+        )
+        return Response(serializer.data)
+
+
+class ExportViewSet(ServerTimingMixin, DataVersionMixin, viewsets.ViewSet):
+    """
+    Streams a user's whole history as NDJSON (the default) or CSV, picked by
+    the Accept header or `?format=`.
+    """
+
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [NDJSONRenderer, CSVRenderer]
+
+    def stream(self, request, name, columns, rows):
+        renderer = request.accepted_renderer
+        content = renderer.stream(columns, rows)
+        if isinstance(request._request, ASGIRequest):
+            content = aiterate(content)
+        response = StreamingHttpResponse(
+            content,
+            content_type=renderer.media_type
+            + (f"; charset={renderer.charset}" if renderer.charset else ""),
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{name}.{renderer.format}"'
+        )
+        return response
+
+    @action(detail=False, methods=["get"])
+    def workouts(self, request):
+        return self.stream(request, "workouts", *workout_export(request.user))
+
+    @action(detail=False, methods=["get"])
+    def measurements(self, request):
+        return self.stream(request, "measurements", *measurement_export(request.user))
+
+
+class ImportViewSet(ServerTimingMixin, DataVersionMixin, viewsets.ViewSet):
+    """
+    Imports history posted as CSV, NDJSON or a JSON array of rows, in the
+    shape of the exports. Invalid rows are reported and skipped; the rest is
+    written in one transaction.
+    """
+
+    permission_classes = [IsAuthenticated]
+    parser_classes = [CSVParser, NDJSONParser, ORJSONParser]
+
+    def run_import(self, request, import_rows):
+        if not isinstance(request.data, list):
+            raise ParseError("Expected a list of rows.")
+
+        report = import_rows(request.user, request.data)
+        imported = any(report["imported"].values())
+        return Response(
+            report,
+            status=status.HTTP_201_CREATED if imported else status.HTTP_400_BAD_REQUEST,
+        )
+
+    @action(detail=False, methods=["post"])
+    def workouts(self, request):
+        return self.run_import(request, import_workouts)
+
+    @action(detail=False, methods=["post"])
+    def measurements(self, request):
+        return self.run_import(request, import_measurements)
+
 
 # EXERCISE
 
 
-class ExerciseTypeViewSet(viewsets.ReadOnlyModelViewSet):
+class ExerciseTypeViewSet(
+    ServerTimingMixin, CatalogCacheMixin, viewsets.ReadOnlyModelViewSet
+):
+    catalog_name = "exercise-types"
     queryset = ExerciseType.objects.order_by("name")
     serializer_class = ExerciseTypeSerializer
     permission_classes = [AllowAny]
 
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request):
+        query = ExerciseTypeSearchQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+
+        exercise_types = search_exercise_types(**query.validated_data)
+        serializer = self.get_serializer(
+            exercise_types, many=True, serializer_class=ExerciseTypeSerializer
+        )
+        return Response(serializer.data)
+
 
-class ExerciseLogViewSet(viewsets.ModelViewSet):
+class ExerciseLogViewSet(
+    ServerTimingMixin,
+    SparseFieldsetMixin,
+    FastReadMixin,
+    DataVersionMixin,
+    viewsets.ModelViewSet,
+):
     permission_classes = [IsAuthenticated]
+    fast_reader = ExerciseLogReader
 
     def get_queryset(self):
-        return ExerciseLog.objects.filter(workout_log__user=self.request.user)
+        exercise_logs = ExerciseLog.objects.filter(
+            workout_log__user=self.request.user
+        ).order_by("id")
+        fieldset = self.get_fieldset()
+        if expands(fieldset, "exercise_type"):
+            exercise_logs = exercise_logs.select_related("exercise_type")
+        if expands(fieldset, "exercise_sets", many=True):
+            exercise_logs = exercise_logs.prefetch_related(exercise_sets_prefetch())
+        return exercise_logs
 
     def get_serializer_class(self):
         if self.action in ["create", "update", "partial_update", "destroy"]:
@@ -169,20 +447,35 @@ class ExerciseLogViewSet(viewsets.ModelViewSet):
 
         serializer.save(workout_log=workout)
 
+    def perform_destroy(self, instance):
+        instance.delete()
+        restore_personal_records(self.request.user.id, [instance.exercise_type_id])
 
-class ExerciseSetViewSet(viewsets.ModelViewSet):
+
+class ExerciseSetViewSet(ServerTimingMixin, DataVersionMixin, viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     serializer_class = ExerciseSetSerializer
 
     def get_queryset(self):
         return ExerciseSet.objects.filter(
             exercise_log__workout_log__user=self.request.user
-        )
+        ).select_related("exercise_log__workout_log")
 
     def perform_create(self, serializer):
         exercise = get_object_or_404(
-            ExerciseLog,
+            ExerciseLog.objects.select_related("workout_log"),
             id=self.kwargs["exercise_pk"],
             workout_log__user=self.request.user,
         )
-        serializer.save(exercise_log=exercise)
+        exercise_set = serializer.save(exercise_log=exercise)
+        record_exercise_sets(self.request.user.id, [exercise_set])
+
+    def perform_update(self, serializer):
+        exercise_set = serializer.save()
+        record_exercise_sets(self.request.user.id, [exercise_set])
+
+    def perform_destroy(self, instance):
+        instance.delete()
+        restore_personal_records(
+            self.request.user.id, [instance.exercise_log.exercise_type_id]
+        )
@@ -1,4 +1,5 @@
 from django.contrib import admin
+from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import path, include
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
@@ -11,3 +12,7 @@ urlpatterns = [
     # path("api-auth/", include("rest_framework.urls")),
     path("api/v1/", include("api.urls")),
 ]
+
+# uvicorn serves no static files itself; in DEBUG the admin's and the
+# browsable API's are served from here.
+urlpatterns += staticfiles_urlpatterns()
@@ -1,5 +1,6 @@
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import api from "../services/api";
+import { fetchAllPages } from "../services/pagination";
 import type { Measurement } from "../types/models";
 
 export const useMeasurements = () => {
@@ -8,8 +9,7 @@ export const useMeasurements = () => {
   const measurementsQuery = useQuery({
     queryKey: ["measurements"],
     queryFn: async () => {
-      const { data } = await api.get<Measurement[]>("api/v1/measurements/");
-      return data;
+      return fetchAllPages<Measurement>("api/v1/measurements/?page_size=200");
     },
     staleTime: 1000 * 60 * 5,
   });
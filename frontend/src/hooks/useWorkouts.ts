@@ -1,5 +1,6 @@
 import { useQuery, useMutation, useQueryClient } from "@tanstack/react-query";
 import api from "../services/api";
+import { fetchAllPages } from "../services/pagination";
 import type { WorkoutLog } from "../types/models";
 import { format, parseISO } from "date-fns";
 
@@ -12,7 +13,9 @@ export const useWorkouts = () => {
   const workoutsQuery = useQuery({
     queryKey: ["workouts"], // The unique ID for this data
     queryFn: async () => {
-      const { data } = await api.get<WorkoutLog[]>("api/v1/workouts/");
+      const data = await fetchAllPages<WorkoutLog>(
+        "api/v1/workouts/?page_size=200"
+      );
 
       return data.map((w) => ({
         ...w,
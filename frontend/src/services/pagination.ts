@@ -0,0 +1,16 @@
+import api from "./api";
+import type { Paginated } from "../types/models";
+
+// Walks the API's cursor links until every page of a collection is loaded.
+export const fetchAllPages = async <T>(url: string): Promise<T[]> => {
+  const items: T[] = [];
+  let next: string | null = url;
+
+  while (next) {
+    const response: { data: Paginated<T> } = await api.get<Paginated<T>>(next);
+    items.push(...response.data.results);
+    next = response.data.next;
+  }
+
+  return items;
+};
@@ -36,7 +36,9 @@ describe("useWorkouts Hook", () => {
     ];
 
     // Tell the mock what to return
-    (api.get as any).mockResolvedValue({ data: mockData });
+    (api.get as any).mockResolvedValue({
+      data: { next: null, previous: null, results: mockData },
+    });
 
     // 2. Render the Hook
     const { result } = renderHook(() => useWorkouts(), {
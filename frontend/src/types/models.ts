@@ -46,3 +46,9 @@ export interface PersonalBest {
   reps: number;
   date: string;
 }
+
+export interface Paginated<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}